@@ -7,17 +7,23 @@ in album/song metadata, and generally pre-/post-processing raw text or
 HTML.
 """
 import re
-from itertools import chain
 from datetime import datetime
-from json import loads, dumps
+from string import ascii_uppercase
+from sys import intern
+from os import environ
+from json import dumps
+from functools import lru_cache
 from operator import itemgetter
 from os.path import dirname, realpath, join
-from typing import Dict, List, Union, Any, Iterable, Tuple
+from typing import Dict, List, Union, Any, Iterable, Tuple, TextIO
 
 import cytoolz
 import pandas as pd
-from bs4.element import Tag
 from bs4 import BeautifulSoup
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 AlbumDictType = Dict[str, Union[str, datetime]]
 SongRelatedAlbumsDictType = Dict[str, Union[str, List[AlbumDictType]]]
@@ -56,21 +62,32 @@ file_dumps_dir_path = join(root_dir_path, file_dumps_dir)
 main_index_html_file_path = join(root_dir_path, main_index_html_file_name)
 home_page_content_file_path = join(root_dir_path, resources_dir,
                                    "home_page_content.md")
+song_text_dir_full_path = join(root_dir_path, text_dir_path)
+song_html_dir_full_path = join(root_dir_path, songs_dir, "html")
+album_html_dir_full_path = join(root_dir_path, albums_dir)
 
-file_id_types_to_skip = ["instrumental", "not_written_or_peformed_by_dylan"]
+file_id_types_to_skip = frozenset(["instrumental",
+                                   "not_written_or_peformed_by_dylan"])
 date_format = "%B %d, %Y"
 
+# Generated pages are written out without any indentation, but, for
+# debugging purposes, they can be pretty-printed by setting this
+# environment variable
+pretty_print_html = bool(environ.get("BOB_DYLAN_LYRICS_PRETTY_PRINT"))
+# Buffer size to use when writing album/song pages (big enough for a
+# whole page, so that each page only gets flushed once)
+page_buffer_size = 1 << 16
+
 # Regular expression- and cleaning-related, etc.
 ANNOTATION_MARK_RE = re.compile(r"\*\*([0-9]+)\*\*")
-replace_inline_annotation_marks = ANNOTATION_MARK_RE.sub
-remove_inline_annotation_marks = lambda x: replace_inline_annotation_marks("", x)
-DOUBLE_QUOTES_RE = re.compile(r"[“”]")
-SINGLE_QUOTES_RE = re.compile(r"‘")
-replace_double_quotes = DOUBLE_QUOTES_RE.sub
-replace_single_quotes = SINGLE_QUOTES_RE.sub
-CLEANUP_REGEXES_DICT = {">": re.compile(r"&gt;"),
-                        "<": re.compile(r"&lt;"),
-                        "&": re.compile(r"&amp;amp;")}
+# Footnote lines (i.e., lines starting with "**") or, elsewhere, inline
+# annotation marks
+ANNOTATIONS_RE = re.compile(r"^\*\*.*\n?|\*\*[0-9]+\*\*", re.MULTILINE)
+replace_annotations = ANNOTATIONS_RE.sub
+COMMENT_LINE_RE = re.compile(br"^#.*\n?", re.MULTILINE)
+replace_comment_lines = COMMENT_LINE_RE.sub
+remove_comment_lines = lambda x: replace_comment_lines(b"", x)
+QUOTES_TRANSLATION_TABLE = str.maketrans({"“": '"', "”": '"', "‘": "'"})
 A_THE_RE = re.compile(r"^(the|a) ")
 substitute_determiner = A_THE_RE.sub
 remove_determiner = lambda x: substitute_determiner(r"", x)
@@ -78,6 +95,132 @@ strip_parens_and_lower_case = lambda x: x.strip("()").lower()
 clean_title = lambda x: remove_determiner(strip_parens_and_lower_case(x))
 get_title_index_letter = lambda x: cytoolz.first(clean_title(x))
 newline_join = "\n".join
+# Lyrics, footnotes, and names can contain inline HTML (e.g.,
+# "<i>...</i>"), so only ampersands get escaped when they are put into
+# pages that are built directly as strings
+escape_ampersands = lambda x: x.replace("&", "&amp;")
+
+# Templates for the head element and for the navigation bar (and its
+# dropdown menus of albums by decade)
+head_template = ('<head><meta charset="utf-8"/>'
+                 '<meta name="viewport" '
+                 'content="width=device-width, initial-scale=1"/>'
+                 '<link rel="stylesheet" '
+                 'href="https://maxcdn.bootstrapcdn.com/bootstrap/3.3.5/css/'
+                 'bootstrap.min.css"/>'
+                 '<link rel="stylesheet" href="{style_sheet}"/>'
+                 '<script src="https://ajax.googleapis.com/ajax/libs/jquery/'
+                 '1.11.3/jquery.min.js"></script>'
+                 '<script src="https://maxcdn.bootstrapcdn.com/bootstrap/'
+                 '3.3.5/js/bootstrap.min.js"></script>'
+                 '<script src="{search_js}"></script>'
+                 '<script src="{analytics_js}"></script></head>')
+navbar_template = ('<nav class="navbar navbar-default">'
+                   '<div class="container-fluid"><div class="navbar-header">'
+                   '<button type="button" class="navbar-toggle collapsed" '
+                   'data-toggle="collapse" '
+                   'data-target="#bs-example-navbar-collapse-1" '
+                   'aria-expanded="false">'
+                   '<span class="sr-only">Toggle navigation</span>'
+                   '<span class="icon-bar"></span>'
+                   '<span class="icon-bar"></span>'
+                   '<span class="icon-bar"></span></button>'
+                   '<a href="{main_index}" class="navbar-brand">'
+                   'Bob Dylan Lyrics</a></div>'
+                   '<div class="navbar-collapse collapse" '
+                   'id="bs-example-navbar-collapse-1" aria-expanded="false" '
+                   'style="height: 1px"><ul class="nav navbar-nav">'
+                   '<li><a href="{downloads}">Downloads</a></li>'
+                   '<li><a href="{song_index}">All Songs</a></li>'
+                   '<li><a href="{album_index}">All Albums</a></li>'
+                   '{decade_dropdowns}</ul>'
+                   '<div class="col-md-3" '
+                   'style="border:0px solid;width:30%;height:auto;">'
+                   '<gcse:search>'
+                   '<form class="navbar-form navbar-right" role="search">'
+                   '</form></gcse:search></div></div></div></nav>')
+navbar_dropdown_template = ('<li class="dropdown"><a href="#" '
+                            'class="dropdown-toggle" data-toggle="dropdown" '
+                            'role="button" aria-haspopup="true" '
+                            'aria-expanded="false">{decade}'
+                            '<span class="caret"></span></a>'
+                            '<ul class="dropdown-menu">{album_lis}</ul></li>')
+navbar_album_li_template = ('<li><a href="{href}" class="album">'
+                            '{name} ({year})</a></li>')
+
+# Templates for song pages (the heading with the song name, the links
+# from annotated lines to their footnotes, and the footnotes themselves)
+song_heading_template = ('<div class="container"><div class="row">'
+                         '<div class="col-md-12"><h1>{name}</h1></div></div>'
+                         '<div class="row"><div class="col-md-12">')
+annotation_link_template = '<a href="#{num}"><sup>{num}</sup></a>'
+footnote_template = ('<div><a name="{num}"><sup>{num}</sup></a>'
+                     '<small>\t{footnote}</small></div>')
+
+# Template for the top of an album page (the heading with the album
+# name and the album attributes next to a picture of the album), which
+# leaves the row open for the list of songs
+album_attributes_template = ('<div class="container"><div class="row">'
+                             '<div class="col-md-12"><h1>{name}</h1></div>'
+                             '</div><div class="row" style="padding-top:12px">'
+                             '<div class="col-md-4"><div>'
+                             '<img src="{image_file_path}" '
+                             'style="padding-bottom:10px" width="300px"/>'
+                             '<div><comment>Released: {release_date}</comment>'
+                             '</div><div><comment>Length: {length}</comment>'
+                             '</div><div><comment>Producer{producers_suffix}: '
+                             '{producers}</comment></div>'
+                             '<div><comment>Label: {label}</comment></div>'
+                             '<div><comment>{by}</comment></div>{live}'
+                             '</div></div>')
+album_live_template = ('<div><comment>Recorded live {date} {location}'
+                       '</comment></div>')
+
+# Templates for the list of songs on an album page (one list element
+# per song, with either a link to the song or a grayed-out song name
+# followed by a parenthetical comment, optionally broken up into
+# sides/discs)
+song_list_template = '<div class="col-md-8"><ol>{songs}</ol></div>'
+song_list_section_template = ('<div>{section_type} {section}</div><p></p>'
+                              '<ol>{songs}</ol><p></p>')
+song_link_li_template = ('<li><a href="{href}">{name}</a>'
+                         '<comment>{comment}</comment></li>')
+song_grayed_out_li_template = ('<li><i><font color="#726E6D">{name}</font></i>'
+                               '<comment><i><font color="#726E6D">{comment}'
+                               '</font></i></comment></li>')
+source_album_link_template = '<a href="{href}"><i>{name}</i></a>'
+
+# Templates for the plain list of all albums (albums.html)
+albums_list_template = ('<html><body><h1><a href="{albums_index}">Albums</a>'
+                        '</h1><ol>{album_lis}</ol></body></html>')
+albums_list_li_template = '<li><a href="{href}">{name} ({year})</a></li>'
+
+# Templates for the downloads page (one list element per download file)
+downloads_template = ('<div class="container"><div class="row">'
+                      '<div class="col-md-12"><h3>Lyrics File Downloads</h3>'
+                      '<ul>{download_lis}</ul></div></div></div>')
+download_li_template = ('<li><a href={file_name} download>{file_name}</a>: '
+                        '{description} (up to and including <i><a '
+                        'href="{last_album_href}">{last_album_name}</a></i>) '
+                        '({size} KiB)</li>')
+
+# Templates for the song/album index pages (a heading followed by, on
+# the main index pages, links to the index pages for each letter and,
+# on the album index pages for each letter, the albums)
+index_heading_template = ('<div class="container"><div class="row">'
+                          '<div class="col-md-12"><h1>{title}</h1>'
+                          '</div></div><p></p>')
+index_letter_link_template = ('<div class="row"><div class="col-md-12"><div>'
+                              '<letter><a href="{letter_lower}.html">'
+                              '<strong style="font-size: 125%;">{letter}'
+                              '</strong></a></letter></div></div></div>')
+index_letter_links = {letter: index_letter_link_template
+                              .format(letter_lower=letter.lower(),
+                                      letter=letter)
+                      for letter in ascii_uppercase}
+album_index_entry_template = ('<div class="col-md-12"><div class="row"><div>'
+                              '<a href="../{file_id}.html">{name} </a>'
+                              '<comment>({year})</comment></div></div></div>')
 
 class Album():
     """
@@ -97,7 +240,8 @@ class Album():
         self.sides = metadata.get("sides")
         self.image_file_name = metadata.get("image_file_name")
         self.release_date = metadata.get("release_date")
-        self.year = self.release_date.split()[-1]
+        self.year = self.release_date.rsplit(None, 1)[-1]
+        self.decade = "{0}0s".format(self.year[:3])
         self.producers = metadata.get("producers")
         self.label = metadata.get("label")
         self.with_ = metadata.get("with", "")
@@ -149,9 +293,14 @@ class Song():
 
     def __init__(self, name: str, metadata: Dict[str, Any]):
 
-        self.name = name
-        self.actual_name = metadata.get("actual_name")
-        self.file_id = metadata.get("file_id")
+        # The same song names and file IDs come up again and again
+        # (once per album that a song appears on), so intern them
+        # since they get used as dictionary keys over and over
+        actual_name = metadata.get("actual_name")
+        file_id = metadata.get("file_id")
+        self.name = intern(name)
+        self.actual_name = intern(actual_name) if actual_name else actual_name
+        self.file_id = intern(file_id) if file_id else file_id
         self.source = metadata.get("source", {})
         self.sung_by = metadata.get("sung_by", "")
         self.instrumental = metadata.get("instrumental", "")
@@ -214,17 +363,18 @@ def generate_lyrics_download_files(song_dicts: List[Dict[str, str]]) -> None:
     :rtype: None
     """
 
-    # Write big file with all of the songs + some metadata
-    song_text_with_metadata_lines = []
-    for song_dict in song_dicts:
-        song_text_with_metadata_lines.append("Song name: {}".format(song_dict["name"]))
-        song_text_with_metadata_lines.append("Album name: {}".format(song_dict["album"]))
-        song_text_with_metadata_lines.append("Lyrics:\n\n{}\n".format(song_dict["text"]))
-    song_text_with_metadata = newline_join(song_text_with_metadata_lines).strip()
+    # Write big file with all of the songs + some metadata (one song
+    # at a time rather than building up the whole text in memory first)
     song_text_with_metadata_path = join(file_dumps_dir_path,
                                         all_songs_with_metadata_file_name)
     with open(song_text_with_metadata_path, "w") as song_text_with_metadata_file:
-        print(song_text_with_metadata, file=song_text_with_metadata_file, end="")
+        separator = ""
+        for song_dict in song_dicts:
+            song_text_with_metadata_file.write(
+                f"{separator}Song name: {song_dict['name']}\n"
+                f"Album name: {song_dict['album']}\n"
+                f"Lyrics:\n\n{song_dict['text']}")
+            separator = "\n\n"
 
     # Write metadata file in CSV form with extra year information
     song_text_with_metadata_csv_path = join(file_dumps_dir_path,
@@ -238,18 +388,26 @@ def generate_lyrics_download_files(song_dicts: List[Dict[str, str]]) -> None:
         for song_dict in song_dicts:
             print(dumps(song_dict), file=jsonlines_file)
 
-    # Write big file with all songs (even duplicates)
-    song_text = newline_join(chain(*[[line.strip() for line
-                                      in song_dict["text"].strip().splitlines()
-                                      if line.strip()]
-                                     for song_dict in song_dicts]))
+    # Write big file with all songs (even duplicates), one song at a
+    # time, and keep track of the unique lines along the way
+    unique_song_lines = set()
     song_text_path = join(file_dumps_dir_path, all_songs_file_name)
     with open(song_text_path, "w") as song_text_file:
-        print(song_text, file=song_text_file, end="")
+        separator = ""
+        for song_dict in song_dicts:
+            song_lines = [line.strip() for line
+                          in song_dict["text"].strip().splitlines()
+                          if line.strip()]
+            if not song_lines:
+                continue
+            song_text_file.write(separator)
+            song_text_file.write(newline_join(song_lines))
+            unique_song_lines.update(song_lines)
+            separator = "\n"
 
     # Write big file with all unique lines from all songs (ensure order
     # doesn't change if all else stays the same)
-    unique_song_text = newline_join(sorted(set(song_text.splitlines()),
+    unique_song_text = newline_join(sorted(unique_song_lines,
                                            key=lambda x: x[-1]))
     unique_song_text_path = join(file_dumps_dir_path,
                                  all_songs_unique_file_name)
@@ -270,8 +428,8 @@ def sort_titles(titles: Iterable[str], filter_char: str = None) -> List[str]:
                         after being cleaned -- will be filtered out
     :type filter_char: str
 
-    :returns: string generator
-    :rtype: filter
+    :returns: sorted list of strings
+    :rtype: List[str]
 
     :raises: ValueError if any of the strings are empty or there are no
              strings at all
@@ -280,10 +438,20 @@ def sort_titles(titles: Iterable[str], filter_char: str = None) -> List[str]:
     if not titles:
         raise ValueError("Received empty list!")
 
-    filter_func = (lambda x: filter_char.lower() == get_title_index_letter(x)
-                   if filter_char
-                   else None)
-    return filter(filter_func, sorted(titles, key=clean_title))
+    # Clean each title only once and use the cleaned titles both for
+    # filtering (before sorting, so that there is less to sort) and as
+    # the sort keys
+    cleaned_titles = [(clean_title(title), title) for title in titles]
+    if filter_char:
+        filter_char = filter_char.lower()
+        cleaned_titles = [(cleaned_title, title) for cleaned_title, title
+                          in cleaned_titles
+                          if cleaned_title.startswith(filter_char)]
+    else:
+        cleaned_titles = [(cleaned_title, title) for cleaned_title, title
+                          in cleaned_titles if title]
+    cleaned_titles.sort(key=itemgetter(0))
+    return [title for _, title in cleaned_titles]
 
 
 def and_join_album_links(albums: List[Dict[str, Union[str, datetime]]]) -> str:
@@ -311,18 +479,31 @@ def and_join_album_links(albums: List[Dict[str, Union[str, datetime]]]) -> str:
 
     if not len(albums): raise ValueError("No albums!")
 
-    link_template = '<a href="../../albums/{0}.html">{1} ({2})</a>'
-    link = (lambda x: link_template.format(x["file_id"],
-                                           x["name"],
-                                           x["release_date"].year))
+    # The same albums come up together for many songs, so the joined
+    # links are cached for each distinct sequence of albums
+    return _and_join_album_links(tuple((album["file_id"], album["name"],
+                                        album["release_date"].year)
+                                       for album in albums))
 
-    if len(albums) == 1:
-        return link(cytoolz.first(albums))
-    elif len(albums) == 2:
-        return " and ".join([link(album) for album in albums[-2:]])
+
+@lru_cache(maxsize=None)
+def _and_join_album_links(albums: Tuple[Tuple[str, str, int], ...]) -> str:
+    """
+    Cached implementation of `and_join_album_links` (which takes the
+    albums as a tuple of file ID/name/year tuples so that they can be
+    hashed).
+    """
+
+    links = [f'<a href="../../albums/{file_id}.html">'
+             f'{escape_ampersands(name)} ({year})</a>'
+             for file_id, name, year in albums]
+    if len(links) == 1:
+        return links[0]
+    elif len(links) == 2:
+        return " and ".join(links)
     else:
-        last_two = ", and ".join([link(album) for album in albums[-2:]])
-        return ", ".join([link(album) for album in albums[:-2]] + [last_two])
+        return "{0}, {1}".format(", ".join(links[:-2]),
+                                 ", and ".join(links[-2:]))
 
 
 def get_date(date_string):
@@ -377,11 +558,16 @@ def read_songs_index(index_json_path: str) -> Tuple[List[Album],
     :raises: ValueError
     """
 
+    # Read in the whole index file (as bytes, which both orjson and
+    # json can parse directly) and strip out the comment lines before
+    # handing it off to the JSON parser
+    with open(index_json_path, "rb") as index_json_file:
+        index_json = remove_comment_lines(index_json_file.read())
+
     albums = []
-    for collection in sorted(loads(newline_join([line for line
-                                                 in open(index_json_path)
-                                                 if not line.startswith("#")])),
-                             key=lambda x: get_date(x["metadata"]["release_date"])):
+    for collection in sorted(
+            loads(index_json),
+            key=lambda x: get_date(x["metadata"]["release_date"])):
 
         if collection["type"] == "album":
 
@@ -404,8 +590,11 @@ def read_songs_index(index_json_path: str) -> Tuple[List[Album],
 
     # Make a dictionary mapping song names to a list of song versions
     # (file IDs, original album, etc.) for use in building the song
-    # index
+    # index (and keep an index of the versions by song name and file
+    # ID so that the entry for a version can be found without scanning
+    # over all of the song's versions)
     song_files_dict = {}
+    song_versions_dict = {}
     for album in albums:
         for song in album.songs:
 
@@ -428,29 +617,24 @@ def read_songs_index(index_json_path: str) -> Tuple[List[Album],
 
             file_album_dict = {"name": album.name, "file_id": album.file_id,
                                "release_date": get_date(album.release_date)}
-            if song_name not in song_files_dict:
-                song_files_dict[song_name] = [{"file_id": song_file_id,
-                                               "album(s)": [file_album_dict]}]
-            else:
 
-                # Iterate over the entries in `song_files_dict` for a
-                # given song, each entry corresponding to a different
-                # `file_id` (basically, a different version of the same
-                # song) and, if an entry for the song's file ID is
-                # found, add its album to the list of albums associated
-                # with that file ID/version, and, if not, then add the
-                # file ID/version to the list of versions associated
-                # with the song (i.e., with its own list of albums)
-                found_file_id_in_song_dicts = False
-                if song_file_id not in file_id_types_to_skip:
-                    for file_ids_dict in song_files_dict[song_name]:
-                        if file_ids_dict["file_id"] == song_file_id:
-                            file_ids_dict["album(s)"].append(file_album_dict)
-                            found_file_id_in_song_dicts = True
-                            break
-                if not found_file_id_in_song_dicts:
-                    song_files_dict[song_name].append({"file_id": song_file_id,
-                                                       "album(s)": [file_album_dict]})
+            # Look up the entry in `song_files_dict` for the given song
+            # and file ID (basically, a version of the song) and, if it
+            # is found, add the album to the list of albums associated
+            # with that file ID/version, and, if not, then add the file
+            # ID/version to the list of versions associated with the
+            # song (i.e., with its own list of albums)
+            song_version_key = (song_name, song_file_id)
+            if song_file_id in file_id_types_to_skip:
+                song_version_dict = None
+            else:
+                song_version_dict = song_versions_dict.get(song_version_key)
+            if song_version_dict is None:
+                song_version_dict = {"file_id": song_file_id, "album(s)": []}
+                song_files_dict.setdefault(song_name,
+                                           []).append(song_version_dict)
+                song_versions_dict[song_version_key] = song_version_dict
+            song_version_dict["album(s)"].append(file_album_dict)
 
     return albums, song_files_dict
 
@@ -468,8 +652,61 @@ def add_html_declaration(html: str) -> str:
     :rtype: str
     """
 
-    return str(BeautifulSoup("<!DOCTYPE html>\n{0}".format(html),
-                             "html.parser"))
+    return "<!DOCTYPE html>\n{0}".format(html)
+
+
+def write_html_page(html_file: TextIO, head: str, navbar: str,
+                    content: Iterable[str]) -> None:
+    """
+    Write a full HTML page, including the declaration, to a file piece
+    by piece (i.e., without first concatenating everything into a
+    single string) out of already-rendered head element, navigation
+    bar, and body content strings.
+
+    :param html_file: file object opened for writing
+    :type html_file: TextIO
+    :param head: rendered head element
+    :type head: str
+    :param navbar: rendered navigation bar element
+    :type navbar: str
+    :param content: rendered fragments of the body content (i.e.,
+                    everything in the body that comes after the
+                    navigation bar), in order
+    :type content: Iterable[str]
+
+    :returns: None
+    :rtype: None
+    """
+
+    if pretty_print_html:
+        html = "<html>{0}<body>{1}{2}</body></html>".format(head, navbar,
+                                                           "".join(content))
+        html_file.write(prettify_html(html))
+        return
+
+    html_file.write("<!DOCTYPE html>\n<html>")
+    html_file.write(head)
+    html_file.write("<body>")
+    html_file.write(navbar)
+    for fragment in content:
+        html_file.write(fragment)
+    html_file.write("</body></html>\n")
+
+
+def prettify_html(html: str) -> str:
+    """
+    Add a declaration to and pretty-print a string representation of an
+    HTML page (only meant to be used for debugging since it requires
+    parsing the whole page).
+
+    :param html: raw HTML content
+    :type html: str
+
+    :returns: HTML string
+    :rtype: str
+    """
+
+    return BeautifulSoup(add_html_declaration(html), "html.parser").prettify()
 
 
 def remove_annotations(text: str) -> str:
@@ -489,12 +726,9 @@ def remove_annotations(text: str) -> str:
     if not text:
         raise ValueError('"text" is empty!')
 
-    # Remove footnotes and inline annotation marks
-    text = newline_join([line for line in text.split("\n")
-                         if not line.startswith("**")])
-    text = remove_inline_annotation_marks(text)
-
-    return text
+    # Remove footnotes and inline annotation marks (together in a
+    # single regular expression pass over the whole text)
+    return replace_annotations("", text)
 
 
 def standardize_quotes(text: str) -> str:
@@ -509,139 +743,89 @@ def standardize_quotes(text: str) -> str:
     :rtype: str
     """
 
-    return replace_single_quotes(r"'", replace_double_quotes(r'"', text))
+    return text.translate(QUOTES_TRANSLATION_TABLE)
 
 
-def clean_up_html(html: str) -> str:
+def make_head_element(level: int = 0) -> str:
     """
-    Clean up HTML generated via BeautifulSoup by converting
-    "&lt;"/"&gt;" character sequences to "<"/">".
+    Make a head element including stylesheets, Javascript, etc.
 
-    :param html: input HTML
-    :type html: str
+    :param level: number of levels down (from the root) the file for
+                  which this head element will be used is located, if
+                  any
+    :type level: int
 
-    :returns: output HTML
+    :returns: HTML head element
     :rtype: str
     """
 
-    for sub, regex in CLEANUP_REGEXES_DICT.items():
-        html = regex.sub(sub, html)
-
-    return html
-
-
-def prepare_html(html: Tag) -> str:
-    """
-    Clean up HTML and add a declaration.
-
-    :param html: input Tag object representing a full HTML page
-    :type html: Tag
+    resources_dir_rel_path = f"{'../'*level}{resources_dir}"
+    return head_template.format(
+        style_sheet=f"{resources_dir_rel_path}/{custom_style_sheet_file_name}",
+        search_js=f"{resources_dir_rel_path}/search.js",
+        analytics_js=f"{resources_dir_rel_path}/analytics.js")
 
-    :returns: output HTML
-    :rtype: str
-    """
 
-    return add_html_declaration(clean_up_html(html.prettify()))
+# Rendered head elements for each of the levels (from the root) at which
+# pages are generated (since the head element only depends on the
+# level, it can be rendered once when the module is loaded)
+head_html_by_level = {level: make_head_element(level) for level in range(3)}
 
 
-def find_annotation_indices(line: str, annotations: List[str]) -> List[int]:
+def make_navbar_element(albums: List[Album], level: int = 0) -> str:
     """
-    Get list of annotation indices in a sentence (treating the
-    annotations themselves as zero-length entities).
-
-    Note that, despite the fact that this function can deal with lines
-    that have multiple annotations, the presence of multiple
-    annotations on the same line is problematic and is not dealt with
-    correctly. Thus, this function should only be used in cases where
-    there is only one annotation maximum.
+    Generate a navigation bar element to insert into webpages for
+    songs, albums, etc.
 
-    :param line: original line (including annotations)
-    :type line: str
-    :param annotations: list of annotation values, i.e., the numbered
-                        part of each annotation
-    :type annotations: list
+    :param albums: list of Album objects
+    :type albums: List[Album]
+    :param level: number of levels down (from the root) the file for
+                  which this navigation bar will be used is located, if
+                  any
+    :type level: int
 
-    :returns: list of indices for zero-length annotations in line
-    :rtype: list
+    :returns: HTML navigation bar element
+    :rtype: str
     """
 
-    indices = []
+    up_levels = "../"*level
 
-    # Figure out the indices of the zero-length annotations
-    i = 0
-    annotation_index = 0
-    line = line.strip().split("**")
-    for part in line:
-        try:
-            if part == annotations[annotation_index]:
-                indices.append(i)
-                annotation_index += 1
-                continue
-        except IndexError:
-            pass
-        if part not in annotations:
-            i += len(part)
+    # Group the albums by decade (in a single pass)
+    albums_by_decade = cytoolz.groupby(lambda album: album.decade, albums)
 
-    if len(annotations) != annotation_index:
-        raise ValueError('One or more annotations were not found. annotations '
-                         '= {0}, line = "{1}".'.format(annotations, line))
-
-    return indices
-
-
-def make_head_element(level: int = 0) -> Tag:
-    """
-    Make a head element including stylesheets, Javascript, etc.
-
-    :param level: number of levels down (from the root) the file for
-                  which this head element will be used is located, if
-                  any
-    :type level: int
+    # Make dropdown menus for albums by decade
+    albums_dir_rel_path = f"{up_levels}{albums_dir}"
+    decade_dropdowns = []
+    for decade in ["1960s", "1970s", "1980s", "1990s", "2000s", "2010s"]:
 
-    :returns: HTML head element
-    :rtype: Tag
-    """
-
-    head = Tag(name="head")
-    head.append(Tag(name="meta", attrs={"charset": "utf-8"}))
-    meta_tag = Tag(name="meta",
-                   attrs={"name": "viewport",
-                          "content": "width=device-width, initial-scale=1"})
-    head.append(meta_tag)
-    head.append(
-        Tag(name="link",
-            attrs=
-                {"rel": "stylesheet",
-                 "href": "https://maxcdn.bootstrapcdn.com/bootstrap/3.3.5/css/"
-                         "bootstrap.min.css"}))
-    head.append(Tag(name="link",
-                    attrs={"rel": "stylesheet",
-                           "href": join(*[".."]*level, resources_dir,
-                                        custom_style_sheet_file_name)}))
-    head.append(
-        Tag(name="script",
-            attrs=
-                {"src": "https://ajax.googleapis.com/ajax/libs/jquery/1.11.3/"
-                        "jquery.min.js"}))
-    head.append(
-        Tag(name="script",
-            attrs={
-                "src": "https://maxcdn.bootstrapcdn.com/bootstrap/3.3.5/js/"
-                       "bootstrap.min.js"}))
-    head.append(Tag(name="script",
-                    attrs={"src": join(*[".."]*level, resources_dir,
-                                       "search.js")}))
-    head.append(Tag(name="script",
-                    attrs={"src": join(*[".."]*level, resources_dir,
-                                       "analytics.js")}))
-
-    return head
-
-
-def make_navbar_element(albums: List[Album], level: int = 0) -> Tag:
+        # Add albums from the given decade into the decade dropdown menu
+        album_lis = []
+        for album in albums_by_decade.get(decade, []):
+            album_lis.append(navbar_album_li_template.format(
+                href=f"{albums_dir_rel_path}/{album.file_id}.html",
+                name=escape_ampersands(album.name),
+                year=album.year))
+        decade_dropdowns.append(navbar_dropdown_template.format(
+            decade=decade, album_lis="".join(album_lis)))
+
+    # Fill in the links for the "Bob Dylan Lyrics" button and the
+    # buttons for the downloads page and the song/album indices
+    return navbar_template.format(
+        main_index=f"{up_levels}{main_index_html_file_name}",
+        downloads=f"{up_levels}{file_dumps_dir}/{downloads_file_name}",
+        song_index=(f"{up_levels}{songs_dir}/{song_index_dir}/"
+                    f"{song_index_html_file_name}"),
+        album_index=(f"{up_levels}{albums_dir}/{album_index_dir}/"
+                     f"{album_index_html_file_name}"),
+        decade_dropdowns="".join(decade_dropdowns))
+
+
+def render_navbar(albums: List[Album], level: int = 0) -> str:
     """
-    Generate a navigation bar element to insert into webpages for
-    songs, albums, etc.
+    Render a navigation bar element (see `make_navbar_element`) to a
+    string. Since every page includes a navigation bar and it only
+    depends on the albums and the level, it only gets built once per
+    level.
 
     :param albums: list of Album objects
     :type albums: List[Album]
@@ -650,121 +834,18 @@ def make_navbar_element(albums: List[Album], level: int = 0) -> Tag:
                   any
     :type level: int
 
-    :returns: HTML head element
-    :rtype: Tag
-    """
-
-    up_levels = join("", *[".."]*level)
-
-    # Create a navigation element in which to put in buttons and
-    # dropdown menus, etc.
-    top_level_nav = Tag(name="nav", attrs={"class": "navbar navbar-default"})
-    container_div = Tag(name="div", attrs={"class": "container-fluid"})
-    navbar_header_div = Tag(name="div", attrs={"class": "navbar-header"})
-    navbar_collapse_button = Tag(name="button",
-                                 attrs={"type": "button",
-                                        "class": "navbar-toggle collapsed",
-                                        "data-toggle": "collapse",
-                                        "data-target": "#bs-example-navbar-collapse-1",
-                                        "aria-expanded": "false"})
-    button_span1 = Tag(name="span", attrs={"class": "sr-only"})
-    button_span1.string = "Toggle navigation"
-    button_span2 = Tag(name="span", attrs={"class": "icon-bar"})
-    button_span3 = Tag(name="span", attrs={"class": "icon-bar"})
-    button_span4 = Tag(name="span", attrs={"class": "icon-bar"})
-    navbar_collapse_button.append(button_span1)
-    navbar_collapse_button.append(button_span2)
-    navbar_collapse_button.append(button_span3)
-    navbar_collapse_button.append(button_span4)
-    navbar_header_div.append(navbar_collapse_button)
-    
-    # Add in "Bob Dylan Lyrics" button/link and buttons/links for the
-    # downloads page and the songs index
-    main_index_file_rel_path = join(up_levels, main_index_html_file_name)
-    a_site = Tag(name="a",
-                 attrs={"href": main_index_file_rel_path,
-                        "class": "navbar-brand"})
-    a_site.string = "Bob Dylan Lyrics"
-    navbar_header_div.append(a_site)
-    container_div.append(navbar_header_div)
-    navbar_collapse_div = Tag(name="div",
-                              attrs={"class": "navbar-collapse collapse",
-                                     "id": "bs-example-navbar-collapse-1",
-                                     "aria-expanded": "false",
-                                     "style": "height: 1px"})
-    navbar_ul = Tag(name="ul", attrs={"class": "nav navbar-nav"})
-    downloads_li = Tag(name="li")
-    downloads_file_rel_path = join(up_levels, file_dumps_dir,
-                                   downloads_file_name)
-    a_downloads = Tag(name="a", attrs={"href": downloads_file_rel_path})
-    a_downloads.string = "Downloads"
-    downloads_li.append(a_downloads)
-    navbar_ul.append(downloads_li)
-    song_index_li = Tag(name="li")
-    song_index_file_rel_path = join(up_levels, songs_dir, song_index_dir,
-                                    song_index_html_file_name)
-    a_song_index = Tag(name="a", attrs={"href": song_index_file_rel_path})
-    a_song_index.string = "All Songs"
-    song_index_li.append(a_song_index)
-    navbar_ul.append(song_index_li)
-    album_index_li = Tag(name="li")
-    album_index_file_rel_path = join(up_levels, albums_dir, album_index_dir,
-                                     album_index_html_file_name)
-    a_album_index = Tag(name="a", attrs={"href": album_index_file_rel_path})
-    a_album_index.string = "All Albums"
-    album_index_li.append(a_album_index)
-    navbar_ul.append(album_index_li)
-
-    # Add in dropdown menus for albums by decade
-    for decade in ["1960s", "1970s", "1980s", "1990s", "2000s", "2010s"]:
-        dropdown_li = Tag(name="li", attrs={"class": "dropdown"})
-        a_dropdown = Tag(name="a",
-                         attrs={"href": "#",
-                                "class": "dropdown-toggle",
-                                "data-toggle": "dropdown",
-                                "role": "button",
-                                "aria-haspopup": "true",
-                                "aria-expanded": "false"})
-        a_dropdown.string = decade
-        caret_span = Tag(name="span", attrs={"class": "caret"})
-        a_dropdown.append(caret_span)
-        dropdown_li.append(a_dropdown)
-        dropdown_menu_ul = Tag(name="ul", attrs={"class": "dropdown-menu"})
-        
-        # Add albums from the given decade into the decade dropdown menu
-        albums_dir_rel_path = join(up_levels, albums_dir)
-        decade_albums = [album for album in albums
-                         if decade[:3] in album.release_date.split()[-1][:3]]
-        for album in decade_albums:
-            album_file_name = "{0}.html".format(album.file_id)
-            year = album.release_date.split()[-1]
-            album_li = Tag(name="li")
-            album_index_file_rel_path = join(albums_dir_rel_path, album_file_name)
-            album_a = Tag(name="a",
-                          attrs={"href": album_index_file_rel_path,
-                                 "class": "album"})
-            album_a.string = "{0} ({1})".format(album.name, year)
-            album_li.append(album_a)
-            dropdown_menu_ul.append(album_li)
-
-        dropdown_li.append(dropdown_menu_ul)
-        navbar_ul.append(dropdown_li)
-
-    navbar_collapse_div.append(navbar_ul)
-
-    # Add in search box
-    search_div = Tag(name="div",
-                     attrs={"class": "col-md-3",
-                            "style": "border:0px solid;width:30%;height:auto;"})
-    gcse_tag = Tag(name="gcse:search")
-    search_form = Tag(name="form",
-                      attrs={"class": "navbar-form navbar-right",
-                             "role": "search"})
-    gcse_tag.append(search_form)
-    search_div.append(gcse_tag)
-    navbar_collapse_div.append(search_div)
-
-    container_div.append(navbar_collapse_div)
-    top_level_nav.append(container_div)
-
-    return top_level_nav
+    :returns: rendered navigation bar element
+    :rtype: str
+    """
+
+    return _render_navbar(tuple(albums), level)
+
+
+@lru_cache(maxsize=None)
+def _render_navbar(albums: Tuple[Album, ...], level: int) -> str:
+    """
+    Cached implementation of `render_navbar` (which takes the albums as
+    a tuple so that they can be hashed).
+    """
+
+    return make_navbar_element(list(albums), level)
@@ -15,18 +15,18 @@ Usage:
           lyrics downloads files, which contain collections of the raw
           lyrics files.
 """
-import sys
+import logging
 from math import ceil
-from glob import glob
+from functools import lru_cache, partial
 from itertools import chain
 from string import ascii_uppercase
-from os.path import join, getsize, exists, basename
+from os import scandir
+from os.path import join, getsize, getmtime, basename, dirname
+from concurrent.futures import ProcessPoolExecutor
 
 import cytoolz
-from bs4.element import Tag
-from bs4 import BeautifulSoup
 from markdown import Markdown
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 
 from bob_dylan_lyrics import (Album, Song, SongsRelatedAlbumsDictType,
@@ -37,20 +37,66 @@ from bob_dylan_lyrics import (Album, Song, SongsRelatedAlbumsDictType,
                               all_songs_with_metadata_csv_file_name,
                               all_songs_with_metadata_jsonlines_file_name,
                               all_songs_file_name, all_songs_unique_file_name,
-                              text_dir_path, song_index_dir_path,
+                              song_index_dir_path,
                               songs_and_albums_index_json_file_path,
                               songs_index_html_file_path, album_index_dir_path,
                               albums_index_html_file_path, file_dumps_dir_path,
                               main_index_html_file_path,
+                              song_text_dir_full_path, song_html_dir_full_path,
+                              album_html_dir_full_path,
                               home_page_content_file_path, ANNOTATION_MARK_RE,
-                              remove_inline_annotation_marks,
                               generate_lyrics_download_files,
-                              and_join_album_links, sort_titles,
+                              and_join_album_links, sort_titles, clean_title,
                               read_songs_index, remove_annotations,
-                              standardize_quotes, clean_up_html, prepare_html,
-                              find_annotation_indices, add_html_declaration,
-                              make_head_element, make_navbar_element,
-                              newline_join)
+                              standardize_quotes,
+                              add_html_declaration, head_html_by_level,
+                              render_navbar, write_html_page,
+                              song_heading_template, annotation_link_template,
+                              footnote_template, album_attributes_template,
+                              album_live_template, index_heading_template,
+                              index_letter_links, album_index_entry_template,
+                              song_list_template, song_list_section_template,
+                              song_link_li_template,
+                              song_grayed_out_li_template,
+                              source_album_link_template, albums_list_template,
+                              albums_list_li_template, downloads_template,
+                              download_li_template, escape_ampersands,
+                              page_buffer_size, newline_join)
+
+logger = logging.getLogger(__name__)
+
+# Function that generates the pages for an album in a worker process
+# (see `init_htmlify_album_worker`)
+_worker_htmlify_album_func = None
+
+# Relative link prefixes for pages one level below the root directory
+song_href_prefix = f"../{songs_dir}/html/"
+album_href_prefix = f"../{albums_dir}/"
+album_image_href_prefix = f"../{resources_dir}/{images_dir}/"
+
+
+# Replace the inline annotation marks in a line of lyrics (e.g., "**1**")
+# with links to the corresponding footnotes
+replace_annotation_marks_with_links = \
+    partial(ANNOTATION_MARK_RE.sub,
+            lambda match: annotation_link_template.format(num=match.group(1)))
+
+
+@lru_cache(maxsize=None)
+def convert_home_page_content() -> str:
+    """
+    Convert the home page content (introduction, contributions, etc.),
+    which is stored in a file in the resources directory called
+    "home_page_content.md", from Markdown to HTML. Since the content
+    is static, the conversion only happens once.
+
+    :returns: HTML string
+    :rtype: str
+    """
+
+    with open(home_page_content_file_path,
+              encoding="utf-8") as home_markdown_file:
+        return Markdown().convert(home_markdown_file.read())
 
 
 def generate_index_page(albums: List[Album]) -> None:
@@ -64,40 +110,48 @@ def generate_index_page(albums: List[Album]) -> None:
     :rtype: None
     """
 
-    html = Tag(name="html")
-    
-    # Add in head element
-    html.append(make_head_element(0))
-
-    # Start to construct the body tag, including a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 0))
-
-    # Add in home page content (introduction, contributions, etc.),
-    # which is stored in a file in the resources directory called
-    # "home_page_content.md" (as its name suggests it is in Markdown
-    # format and therefore it will be necessary to convert
-    # automatically from Markdown to HTML)
-    markdowner = Markdown()
-    with open(home_page_content_file_path) as home_markdown_file:
-        home_page_content_html = \
-            BeautifulSoup(markdowner.convert(home_markdown_file.read()),
-                          "html.parser")
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    columns_div.append(home_page_content_html)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-
-    body.append(container_div)
-    html.append(body)
-
+    # Write out the content section by section along with the
+    # pre-rendered head element and navigation bar
     with open(main_index_html_file_path, "w") as index_file:
-        print(prepare_html(html), file=index_file, end="")
+        write_html_page(index_file, head_html_by_level[0],
+                        render_navbar(albums, 0),
+                        ['<div class="container"><div class="row">'
+                         '<div class="col-md-12">',
+                         convert_home_page_content(),
+                         "</div></div></div>"])
+
+
+@lru_cache(maxsize=None)
+def format_written_by(written_by: str) -> str:
+    """
+    Make the parenthetical comment for a song's authorship from the
+    value of its "written_by" attribute. The same credits show up for
+    many songs, so the results are cached.
+
+    :param written_by: authorship string, e.g., "Bob Dylan, Jacques
+                       Levy"
+    :type written_by: str
+
+    :returns: parenthetical comment
+    :rtype: str
+    """
+
+    if written_by.startswith("Traditional"):
+        return f" ({written_by})"
+    if "arranged by" in written_by:
+        return f" (originally written by {written_by})"
+
+    authors = [author.strip() for author in written_by.split(",")]
+    if len(authors) == 1:
+        return f" (original author: {authors[0]})"
+    if len(authors) == 2:
+        authors_string = " and ".join(authors)
+    else:
+        authors_string = f"{', '.join(authors[:-1])}, and {authors[-1]}"
+    return f" (original authors: {authors_string})"
 
 
-def generate_song_list_element(song: Song) -> Tag:
+def generate_song_list_element(song: Song) -> str:
     """
     Make a list element for a song (for use when generating an album
     webpage, for example).
@@ -106,11 +160,9 @@ def generate_song_list_element(song: Song) -> Tag:
     :type song: Song
 
     :returns: HTML list element
-    :rtype: Tag
+    :rtype: str
     """
 
-    # Make a list element for the song
-    li = Tag(name="li")
     sung_by = song.sung_by
     performed_by = song.written_and_performed_by.get("performed_by", "")
     written_by = song.written_by
@@ -129,30 +181,15 @@ def generate_song_list_element(song: Song) -> Tag:
     # (primarily, again), then there will be a special
     # "written_and_performed_by" key.
     if sung_by:
-        sung_by = " (sung by {0})".format(sung_by)
+        sung_by = f" (sung by {sung_by})"
     elif performed_by:
-        performed_by = " (performed by {0})".format(performed_by)
+        performed_by = f" (performed by {performed_by})"
 
     # If the song was written by someone other than Bob Dylan or in
     # partnership with Bob Dylan, make a parenthetical comment for the
     # song's authorship
     if written_by:
-        if written_by.startswith("Traditional"):
-            written_by = " ({})".format(written_by)
-        elif "arranged by" in written_by:
-            written_by = (" (originally written by {})".format(written_by))
-        else:
-            authors = [author.strip() for author in written_by.split(",")]
-            if len(authors) == 1:
-                authors_string = authors[0]
-            elif len(authors) == 2:
-                authors_string = " and ".join(authors)
-            else:
-                authors_string = ", and ".join([", ".join(authors[:-1]),
-                                                authors[-1]])
-            written_by = (" (original author{}: {})"
-                          .format("s" if len(authors) > 1 else "",
-                                  authors_string))
+        written_by = format_written_by(written_by)
 
     # If the song is an instrumental, prepare a parenthetical comment
     # for that as well
@@ -161,135 +198,49 @@ def generate_song_list_element(song: Song) -> Tag:
     # If the song was sung as a duet with somebody else, make a
     # parenthetical comment for that too
     if duet:
-        duet = " (duet with {})".format(duet)
+        duet = f" (duet with {duet})"
 
     # If the song was recorded live in concert, generate a
     # parenthetical comment
     if live:
-        live = " (recorded live {0} {1})".format(live["date"],
-                                                 live["location/concert"])
-
-    # Make a link for the song file if the song is not an instrumental
-    # or was not performed by somebody else
-    a_song = None
+        live = f" (recorded live {live['date']} {live['location/concert']})"
+
+    # If the song isn't an instrumental and wasn't performed by somebody
+    # else, make a list element with a link to the song file and a
+    # comment about the song's original album (if it appeared on a
+    # previous album), the song's authorship if the list of authors
+    # includes someone other than Bob Dylan, and that the song was sung
+    # by someone else, if that applies, etc.
+    name = escape_ampersands(song.name)
     if not instrumental and not performed_by:
-        song_file_path = join("..", songs_dir, "html",
-                              "{0}.html".format(song.file_id))
-        a_song = Tag(name="a", attrs={"href": song_file_path})
-        a_song.string = song.name
-
-    if song.source:
-        if not instrumental and not performed_by:
-
-            li.append(a_song)
-
-            # Construct the string content of the list element,
-            # including the song name itself, a comment about the
-            # song's original album, a comment about the song's
-            # authorship if the list of authors includes someone other
-            # than Bob Dylan, and a comment that the song was sung by
-            # someone else or is basically just not a Bob Dylan song,
-            # if either of those applies, etc.
-            orig_album_file_path = join("..", albums_dir,
-                                        "{0}".format(song.source.get("file_id")))
-            a_orig_album = Tag(name="a", attrs={"href": orig_album_file_path})
-            a_orig_album.string = song.source.get("name")
-            a_orig_album.string.wrap(Tag(name="i"))
-            comment = Tag(name="comment")
-            comment.string = (" (appeared on {0}{1}){2}{3}{4}"
-                              .format(a_orig_album,
-                                      sung_by,
-                                      written_by,
-                                      duet,
-                                      live))
-            li.append(comment)
-
+        if song.source:
+            source_album_link = source_album_link_template.format(
+                href=escape_ampersands(
+                    f"{album_href_prefix}{song.source.get('file_id')}"),
+                name=escape_ampersands(song.source.get("name")))
+            comment = escape_ampersands(f"{sung_by}){written_by}{duet}{live}")
+            comment = f" (appeared on {source_album_link}{comment}"
         else:
-
-            # Add in grayed-out and italicized song name
-            i_song = Tag(name="i")
-            gray = Tag(name="font", attrs={"color": "#726E6D"})
-            gray.string = song.name
-            i_song.append(gray)
-            li.append(i_song)
-
-            # Construct the string content of the list element,
-            # including the song name itself, a comment that the song
-            # is an instrumental song if that applies, a comment about
-            # the song's authorship if the list of authors includes
-            # someone other than Bob Dylan, and a comment that the song
-            # was sung by someone else or is basically just not a Bob
-            # Dylan song, if either of those applies, etc.
-            comment = Tag(name="comment")
-            comment.string = "{0}{1}{2}{3}{4}{5}".format(instrumental,
-                                                         sung_by,
-                                                         performed_by,
-                                                         written_by,
-                                                         duet,
-                                                         live)
-            comment.string.wrap(Tag(name="i"))
-            comment.string.wrap(Tag(name="font", attrs={"color": "#726E6D"}))
-            li.append(comment)
-
-    else:
-
-        # If the song isn't an instrumental and there is an associated
-        # lyrics file, then just add the a-tag for the song into the
-        # list element; otherwise, gray out and italicize the text of
-        # the song name
-        if not instrumental and not performed_by:
-            
-            li.append(a_song)
-            
-            # Construct the string content of the list element,
-            # including the song name itself, a comment that the song
-            # is an instrumental song if that applies, a comment about
-            # the song's authorship if the list of authors includes
-            # someone other than Bob Dylan, and a comment that the song
-            # was sung by someone else or is basically just not a Bob
-            # Dylan song, if either of those applies, etc.
-            comment = Tag(name="comment")
-            comment.string = "{0}{1}{2}{3}{4}{5}".format(instrumental,
-                                                         sung_by,
-                                                         performed_by,
-                                                         written_by,
-                                                         duet,
-                                                         live)
-
-        else:
-
-            # Add in grayed-out and italicized song name
-            i_song = Tag(name="i")
-            gray = Tag(name="font", attrs={"color": "#726E6D"})
-            gray.string = song.name
-            i_song.append(gray)
-            li.append(i_song)
-
-            # Construct the string content of the list element,
-            # including the song name itself, a comment that the song
-            # is an instrumental song if that applies, a comment about
-            # the song's authorship if the list of authors includes
-            # someone other than Bob Dylan, and a comment that the song
-            # was sung by someone else or is basically just not a Bob
-            # Dylan song, if either of those applies, etc.
-            comment = Tag(name="comment")
-            comment.string = "{0}{1}{2}{3}{4}{5}".format(instrumental,
-                                                         sung_by,
-                                                         performed_by,
-                                                         written_by,
-                                                         duet,
-                                                         live)
-            comment.string.wrap(Tag(name="i"))
-            comment.string.wrap(Tag(name="font", attrs={"color": "#726E6D"}))
-
-        li.append(comment)
-
-    return li
+            comment = escape_ampersands(f"{sung_by}{written_by}{duet}{live}")
+        return song_link_li_template.format(
+            href=f"{song_href_prefix}{song.file_id}.html", name=name,
+            comment=comment)
+
+    # Otherwise, gray out and italicize the song name and add a comment
+    # that the song is an instrumental song if that applies, about the
+    # song's authorship if the list of authors includes someone other
+    # than Bob Dylan, and that the song was sung by someone else or is
+    # basically just not a Bob Dylan song, if either of those applies,
+    # etc.
+    return song_grayed_out_li_template.format(
+        name=name,
+        comment=escape_ampersands(f"{instrumental}{sung_by}{performed_by}"
+                                  f"{written_by}{duet}{live}"))
 
 
 def generate_song_list(songs: List[Song],
                        sides: Optional[Dict[str, str]] = None,
-                       discs: Optional[Dict[str, str]] = None) -> Tag:
+                       discs: Optional[Dict[str, str]] = None) -> str:
     """
     Generate an HTML element representing an ordered list of songs.
 
@@ -305,8 +256,8 @@ def generate_song_list(songs: List[Song],
                   i.e., "1" -> "1-5"
     :type discs: Optional[Dict[str, str]]
 
-    :returns: ordered list element
-    :rtype: Tag
+    :returns: ordered list element (in a column)
+    :rtype: str
 
     :raises: ValueError if both `sides` and `discs` are specified or if
              either of the two conflict with assumptions
@@ -317,8 +268,7 @@ def generate_song_list(songs: List[Song],
                          "passed in at a given time: `sides_dict` and "
                          "`discs_dict`.")
 
-    columns_div = Tag(name="div", attrs={"class": "col-md-8"})
-    ol = Tag(name="ol")
+    lis = []
     sections = sides or discs
     if sections:
 
@@ -338,12 +288,6 @@ def generate_song_list(songs: List[Song],
                                  'Offending side/disc ID: "{0}".'
                                  .format(section))
 
-            section_div = Tag(name="div")
-            section_div.string = "{0} {1}".format(section_str, section)
-            ol.append(section_div)
-            ol.append(Tag(name="p"))
-            inner_ol = Tag(name="ol")
-
             # Each side/disc will have an associated range of song
             # indices, e.g. "1-5" (unless a side/disc contains only a
             # single song, in which case it will simply be the song
@@ -351,11 +295,12 @@ def generate_song_list(songs: List[Song],
             if "-" in sections[section]:
                 first, last = sections[section].split("-")
                 try:
-                    if int(first) < 1:
+                    first, last = int(first), int(last)
+                    if first < 1:
                         raise ValueError
-                    if int(last) < 1:
+                    if last < 1:
                         raise ValueError
-                    if int(last) <= int(first):
+                    if last <= first:
                         raise ValueError
                 except ValueError:
                     raise ValueError("Each side's/disc's associated range "
@@ -365,9 +310,9 @@ def generate_song_list(songs: List[Song],
                                      "range: \"{0}\"."
                                      .format(sections[section]))
             else:
-                first = last = sections[section]
                 try:
-                    if int(first) < 1:
+                    first = last = int(sections[section])
+                    if first < 1:
                         raise ValueError
                 except ValueError:
                     raise ValueError("Each side's/disc's associated range can "
@@ -376,43 +321,38 @@ def generate_song_list(songs: List[Song],
                                      "zero. Offending range: \"{0}\"."
                                      .format(sections[section]))
 
-            # Get the expected number of songs for the given side/disc
-            expected_number_of_songs = int(last) - int(first) + 1
-            added_songs = 0
-            for index, song in enumerate(songs):
-                try:
-                    if index + 1 in range(int(first), int(last) + 1):
-                        inner_ol.append(generate_song_list_element(song))
-                        added_songs += 1
-                    if int(last) == index + 1:
-                        break
-                except TypeError:
-                    raise ValueError('The "sides"/"discs" attribute contains '
-                                     'invalid song indices: {0}.'
-                                     .format(sections[section]))
+            # Get the expected number of songs for the given side/disc and
+            # add in the songs in its range of (1-based) song indices
+            expected_number_of_songs = last - first + 1
+            section_lis = [generate_song_list_element(song)
+                           for song in songs[first - 1:last]]
+            added_songs = len(section_lis)
 
             # Make sure the correct number of songs were included
             if added_songs != expected_number_of_songs:
-                print("The number of expected songs ({0}) for the given "
-                      "side/disc ({1}) does not equal the number of songs "
-                      "actually included on the side/disc ({2})."
-                      .format(expected_number_of_songs, section, added_songs),
-                      file=sys.stderr)
-
-            ol.append(inner_ol)
-            ol.append(Tag(name="p"))
+                logger.warning("The number of expected songs ({0}) for the "
+                               "given side/disc ({1}) does not equal the "
+                               "number of songs actually included on the "
+                               "side/disc ({2})."
+                               .format(expected_number_of_songs, section,
+                                       added_songs))
+
+            lis.append(song_list_section_template
+                       .format(section_type=section_str, section=section,
+                               songs="".join(section_lis)))
     else:
-        [ol.append(generate_song_list_element(song)) for song in songs]
+        for song in songs:
+            lis.append(generate_song_list_element(song))
 
-    columns_div.append(ol)
-    
-    return columns_div
+    return song_list_template.format(songs="".join(lis))
 
 
 def htmlify_everything(albums: List[Album],
                        song_files_dict: SongsRelatedAlbumsDictType,
                        make_downloads: bool = False,
-                       allow_file_not_found_error: bool = False) \
+                       allow_file_not_found_error: bool = False,
+                       n_jobs: Optional[int] = 1,
+                       only_changed_songs: bool = False) \
     -> Optional[List[Dict[str, str]]]:
     """
     Create HTML files for the main index page, each album's index page,
@@ -430,66 +370,76 @@ def htmlify_everything(albums: List[Album],
     :param allow_file_not_found_error: skip songs after encountering
                                        one that does not exist ye
     :type allow_file_not_found_error: bool
+    :param n_jobs: number of worker processes to use for generating the
+                   album/song pages (if 1, no worker processes are
+                   used; if None, the number of CPUs is used)
+    :type n_jobs: Optional[int]
+    :param only_changed_songs: only regenerate the song pages whose
+                               lyrics files (or the index file or the
+                               code) have changed since the pages were
+                               last generated
+    :type only_changed_songs: bool
 
     :returns: None or list of song name/album name/year/lyrics tuples
     :rtype: Optional[List[Dict[str, str]]]
     """
 
     # Generate index page for albums
-    print("HTMLifying the albums index page...", file=sys.stderr)
-
-    # Make HTML element for albums index page
-    index_html = Tag(name="html")
-    index_body = Tag(name="body")
-
-    # Add in elements for the heading
-    index_heading = Tag(name="h1")
-    index_heading.string = "Albums"
-    index_heading.string.wrap(Tag(name="a",
-                                  attrs={"href": albums_index_html_file_name}))
-    index_body.append(index_heading)
-
-    # Add in ordered list element for all albums
-    index_ol = Tag(name="ol")
-    for album in albums:
-        album_html_file_name = "{}.html".format(album.file_id)
-        album_html_file_path = join(albums_dir, album_html_file_name)
-        year = album.release_date.split()[-1]
-        li = Tag(name="li")
-        li.string = "{0} ({1})".format(album.name, year)
-        li.string.wrap(Tag(name="a", attrs={"href": album_html_file_path}))
-        index_ol.append(li)
-    index_body.append(index_ol)
-
-    # Put body in HTML element
-    index_html.append(index_body)
+    logger.info("HTMLifying the albums index page...")
+
+    # Make HTML for albums index page (a plain ordered list of all of
+    # the albums)
+    album_lis = "".join([albums_list_li_template
+                         .format(href=f"{albums_dir}/{album.file_id}.html",
+                                 name=escape_ampersands(album.name),
+                                 year=album.year)
+                         for album in albums])
+    index_html = albums_list_template.format(
+        albums_index=albums_index_html_file_name, album_lis=album_lis)
 
     # Write new HTML file for albums index page
     with open(join(root_dir_path,
                    albums_index_html_file_name), "w") as albums_index:
-        print(add_html_declaration(index_html.prettify(formatter="html")),
-              file=albums_index, end="")
+        print(add_html_declaration(index_html), file=albums_index)
+
+    # Generate pages for albums (and their songs), spreading the albums
+    # out over a pool of worker processes unless only one job is to be
+    # used (the pages for each album are independent of each other)
+    logger.info("HTMLifying the individual album pages...")
+    song_inputs_mtime = None
+    if only_changed_songs:
+        song_inputs_mtime = \
+            max(getmtime(songs_and_albums_index_json_file_path),
+                getmtime(__file__),
+                getmtime(join(dirname(__file__), "__init__.py")))
+    htmlify_album_func = \
+        partial(htmlify_album, albums=albums, make_downloads=make_downloads,
+                allow_file_not_found_error=allow_file_not_found_error,
+                song_inputs_mtime=song_inputs_mtime)
+    if n_jobs == 1:
+        album_song_dicts = [htmlify_album_func(album) for album in albums]
+    else:
 
-    # Generate pages for albums
-    print("HTMLifying the individual album pages...", file=sys.stderr)
-    htmlify_album_kwargs = \
-        {"allow_file_not_found_error": allow_file_not_found_error}
+        # Hand the list of albums (and the other arguments) and the
+        # logging level over to each worker process only once, when it
+        # starts up, rather than along with every album
+        with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=init_htmlify_album_worker,
+                initargs=(htmlify_album_func,
+                          logging.getLogger().getEffectiveLevel())) \
+            as executor:
+            album_song_dicts = list(executor.map(htmlify_album_in_worker,
+                                                 albums))
     song_dicts = None
     if make_downloads:
-        htmlify_album_kwargs["make_downloads"] = True
-        song_dicts = list(chain(*[htmlify_album(album, albums,
-                                                **htmlify_album_kwargs)
-                                  for album in albums]))
-    else:
-        [htmlify_album(album, albums, **htmlify_album_kwargs)
-         for album in albums]
+        song_dicts = list(chain(*album_song_dicts))
 
     # Generate the main song index page
-    print("HTMLifying the main song index page...", file=sys.stderr)
+    logger.info("HTMLifying the main song index page...")
     htmlify_main_song_index_page(song_files_dict, albums)
 
     # Generate the main album index page
-    print("HTMLifying the main album index page...", file=sys.stderr)
+    logger.info("HTMLifying the main album index page...")
     htmlify_main_album_index_page(albums)
 
     if make_downloads:
@@ -498,9 +448,52 @@ def htmlify_everything(albums: List[Album],
     return
 
 
+def init_htmlify_album_worker(
+        htmlify_album_func: Callable[[Album],
+                                     Optional[List[Dict[str, str]]]],
+        log_level: int) -> None:
+    """
+    Set up a worker process for generating album/song pages, i.e.,
+    store the function that generates the pages for a given album (with
+    all of its other arguments already filled in) and configure logging
+    in the same way as in the main process (worker processes that are
+    spawned rather than forked do not inherit the configuration).
+
+    :param htmlify_album_func: `htmlify_album` with all arguments but
+                               the album filled in
+    :type htmlify_album_func: Callable[[Album],
+                                       Optional[List[Dict[str, str]]]]
+    :param log_level: logging level of the main process
+    :type log_level: int
+
+    :returns: None
+    :rtype: None
+    """
+
+    global _worker_htmlify_album_func
+    _worker_htmlify_album_func = htmlify_album_func
+    logging.basicConfig(format="%(message)s", level=log_level)
+
+
+def htmlify_album_in_worker(album: Album) -> Optional[List[Dict[str, str]]]:
+    """
+    Generate HTML pages for a particular album and its songs in a
+    worker process set up via `init_htmlify_album_worker`.
+
+    :param album: Album object
+    :type album: Album
+
+    :returns: None or list of song name/album/year/lyrics tuples
+    :rtype: Optional[List[Dict[str, str]]]
+    """
+
+    return _worker_htmlify_album_func(album)
+
+
 def htmlify_album(album: Album, albums: List[Album],
                   make_downloads: bool = False,
-                  allow_file_not_found_error: bool = False) \
+                  allow_file_not_found_error: bool = False,
+                  song_inputs_mtime: Optional[float] = None) \
     -> Optional[List[Dict[str, str]]]:
     """
     Generate HTML pages for a particular album and its songs and,
@@ -516,98 +509,56 @@ def htmlify_album(album: Album, albums: List[Album],
     :param allow_file_not_found_error: skip songs after encountering
                                        one that does not exist ye
     :type allow_file_not_found_error: bool
+    :param song_inputs_mtime: if specified, the last modification time
+                              of the inputs shared by all song pages
+                              (the index file and the code), in which
+                              case song pages that are newer than both
+                              it and their lyrics files are not
+                              regenerated
+    :type song_inputs_mtime: Optional[float]
 
     :returns: None or list of song name/album/year/lyrics tuples
     :rtype: Optional[Dict[str, str]]
     """
 
-    print("HTMLifying index page for {}...".format(album.name),
-          file=sys.stderr)
-
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(1))
-
-    # Generate body for albums page and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 1))
-
-    # Create div tag for the "container"
-    container_div = Tag(name="div", attrs={"class": "container"})
-
-    # Add in elements for the heading
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    heading = Tag(name="h1")
-    heading.string = album.name
-    columns_div.append(heading)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-
-    # Add in the album attributes, including a picture of the album
-    row_div = Tag(name="div",
-                  attrs={"class": "row", "style": "padding-top:12px"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-4"})
-    attrs_div = Tag(name="div")
-    image_file_path = join("..", resources_dir, images_dir, album.image_file_name)
-    image = Tag(name="img",
-                attrs={"src": image_file_path,
-                       "width": "300px",
-                       "style": "padding-bottom:10px"})
-    attrs_div.append(image)
-    release_div = Tag(name="div")
-    release_div.string = "Released: {0}".format(album.release_date)
-    release_div.string.wrap(Tag(name="comment"))
-    attrs_div.append(release_div)
-    length_div = Tag(name="div")
-    length_div.string = "Length: {0}".format(album.length)
-    length_div.string.wrap(Tag(name="comment"))
-    attrs_div.append(length_div)
-    producers_string = album.producers
-    producers_string_template = \
-        "Producer{0}: {1}".format("" if len(producers_string.split(", ")) == 1
-                                  else "(s)", "{0}")
-    producers_div = Tag(name="div")
-    producers_div.string = producers_string_template.format(producers_string)
-    producers_div.string.wrap(Tag(name="comment"))
-    attrs_div.append(producers_div)
-    label_div = Tag(name="div")
-    label_div.string = "Label: {0}".format(album.label)
-    label_div.string.wrap(Tag(name="comment"))
-    attrs_div.append(label_div)
-    by_div = Tag(name="div")
+    logger.debug("HTMLifying index page for {}...".format(album.name))
+
+    # Add in the heading and the album attributes, including a picture
+    # of the album
+    by = "By Bob Dylan"
     if album.with_:
-        by_div.string = "By Bob Dylan and {}".format(album.with_)
-    else:
-        by_div.string = "By Bob Dylan"
-    by_div.string.wrap(Tag(name="comment"))
-    attrs_div.append(by_div)
+        by = f"By Bob Dylan and {album.with_}"
     live = album.live
     if live:
-        live_div = Tag(name="div")
-        live_div.string = ("Recorded live {0} {1}"
-                           .format(live.get("date"), live.get("location/concert")))
-        live_div.string.wrap(Tag(name="comment"))
-        attrs_div.append(live_div)
-    columns_div.append(attrs_div)
-    row_div.append(columns_div)
-
-    # Add in an ordered list element for all songs (or several ordered
-    # lists for each side, disc, etc.)
-    row_div.append(generate_song_list(album.songs, sides=album.sides,
-                                      discs=album.discs))
-    container_div.append(row_div)
-
-    # Add content to body and put body in HTML element
-    body.append(container_div)
-    html.append(body)
-
-    # Write new HTML file for albums index page
-    album_file_path = join(root_dir_path, albums_dir,
-                           "{}.html".format(album.file_id))
-    with open(album_file_path, "w") as album_file:
-        print(prepare_html(html), file=album_file, end="")
+        live = album_live_template.format(
+            date=escape_ampersands(str(live.get("date"))),
+            location=escape_ampersands(str(live.get("location/concert"))))
+    album_html = album_attributes_template.format(
+        name=escape_ampersands(album.name),
+        image_file_path=f"{album_image_href_prefix}{album.image_file_name}",
+        release_date=escape_ampersands(album.release_date),
+        length=escape_ampersands(str(album.length)),
+        producers_suffix=("" if len(album.producers.split(", ")) == 1
+                          else "(s)"),
+        producers=escape_ampersands(album.producers),
+        label=escape_ampersands(str(album.label)),
+        by=escape_ampersands(by),
+        live=live or "")
+
+    # Write new HTML file for albums index page, putting the content
+    # together with the pre-rendered head element (containing
+    # stylesheets, Javascript, etc.) and a navigation bar, and add in
+    # an ordered list element for all songs (or several ordered lists
+    # for each side, disc, etc.)
+    album_file_path = join(album_html_dir_full_path, f"{album.file_id}.html")
+    with open(album_file_path, "w", encoding="utf-8",
+              buffering=page_buffer_size) as album_file:
+        song_list = generate_song_list(album.songs, sides=album.sides,
+                                       discs=album.discs)
+        write_html_page(album_file, head_html_by_level[1],
+                        render_navbar(albums, 1),
+                        [album_html, song_list,
+                         "</div></div>"])
 
     # Generate HTML files for each song (unless a song is indicated as
     # having appeared on previous album(s) since this new instance of
@@ -618,12 +569,20 @@ def htmlify_album(album: Album, albums: List[Album],
     song_lyrics_dicts = []
     for song in album.songs:
 
-        # HTMLify the song
+        # HTMLify the song (reading in its lyrics file only once, even
+        # if the text will also be used for the lyrics download files)
+        song_text = None
         if (not song.instrumental and
             not song.source and
             not song.written_and_performed_by):
             try:
-                htmlify_song(song, albums)
+                if (song_inputs_mtime is not None and
+                    song_page_is_up_to_date(song.file_id, song_inputs_mtime)):
+                    logger.debug("Skipping {} since its page is up to date..."
+                                 .format(song.name))
+                else:
+                    song_text = read_song_text(song.file_id)
+                    htmlify_song(song, albums, song_text=song_text)
             except FileNotFoundError as e:
                 if allow_file_not_found_error:
                     break
@@ -635,44 +594,43 @@ def htmlify_album(album: Album, albums: List[Album],
             not song.instrumental and
             not song.written_and_performed_by):
 
-            input_path = join(root_dir_path, text_dir_path,
-                              "{0}.txt".format(song.file_id))
-            with open(input_path) as song_file:
-                song_text = \
-                    remove_annotations(standardize_quotes(song_file.read())).strip()
-
-                # Remove tags and replace some special characters that
-                # sometimes don't show up correctly
-                song_text_lines = song_text.splitlines()
-                for i in range(len(song_text_lines)):
-                    tags = ["<sup>", "</sup>", "<i>", "</i>", "<p>"]
-                    if any(tag in song_text_lines[i] for tag in tags):
-                        for tag in tags:
-                            song_text_lines[i] = song_text_lines[i].replace(tag, "")
-                    if "–" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("–", "-")
-                    if "é" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("é", "e")
-                    if "ñ" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("ñ", "n")
-                    if "ó" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("ó", "o")
-                    if "í" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("í", "i")
-                    if "á" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("á", "a")
-                    if "î" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("î", "i")
-                    if "ü" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("ü", "u")
-                    if "â" in song_text_lines[i]:
-                        song_text_lines[i] = song_text_lines[i].replace("â", "a")
-                song_text = newline_join(song_text_lines)
-
-                song_lyrics_dicts.append({"name": song.name,
-                                          "album": album.name,
-                                          "album_year": album.year,
-                                          "text": song_text})
+            if song_text is None:
+                song_text = read_song_text(song.file_id)
+            song_text = remove_annotations(song_text).strip()
+
+            # Remove tags and replace some special characters that
+            # sometimes don't show up correctly
+            song_text_lines = song_text.splitlines()
+            for i in range(len(song_text_lines)):
+                tags = ["<sup>", "</sup>", "<i>", "</i>", "<p>"]
+                if any(tag in song_text_lines[i] for tag in tags):
+                    for tag in tags:
+                        song_text_lines[i] = \
+                            song_text_lines[i].replace(tag, "")
+                if "–" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("–", "-")
+                if "é" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("é", "e")
+                if "ñ" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("ñ", "n")
+                if "ó" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("ó", "o")
+                if "í" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("í", "i")
+                if "á" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("á", "a")
+                if "î" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("î", "i")
+                if "ü" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("ü", "u")
+                if "â" in song_text_lines[i]:
+                    song_text_lines[i] = song_text_lines[i].replace("â", "a")
+            song_text = newline_join(song_text_lines)
+
+            song_lyrics_dicts.append({"name": song.name,
+                                      "album": album.name,
+                                      "album_year": album.year,
+                                      "text": song_text})
 
     if make_downloads:
         return song_lyrics_dicts
@@ -680,7 +638,59 @@ def htmlify_album(album: Album, albums: List[Album],
     return
 
 
-def htmlify_song(song: Song, albums: List[Album]) -> None:
+def song_page_is_up_to_date(file_id: str, song_inputs_mtime: float) -> bool:
+    """
+    Check whether the HTML page for a song was generated after the last
+    modification of its lyrics file and of the inputs shared by all song
+    pages.
+
+    :param file_id: song file ID
+    :type file_id: str
+    :param song_inputs_mtime: last modification time of the inputs
+                              shared by all song pages
+    :type song_inputs_mtime: float
+
+    :returns: True if the page exists and is up to date
+    :rtype: bool
+    """
+
+    try:
+        page_mtime = getmtime(join(song_html_dir_full_path, f"{file_id}.html"))
+        text_mtime = getmtime(join(song_text_dir_full_path, f"{file_id}.txt"))
+    except FileNotFoundError:
+        return False
+    return page_mtime >= max(text_mtime, song_inputs_mtime)
+
+
+def read_song_text(file_id: str) -> str:
+    """
+    Read in the raw text file containing the lyrics for a song,
+    standardizing the quotes and stripping off surrounding whitespace.
+
+    :param file_id: song file ID
+    :type file_id: str
+
+    :returns: song text
+    :rtype: str
+
+    :raises: FileNotFoundError if the song text file does not exist
+    """
+
+    # Just try to open the file (rather than checking whether it exists
+    # first, which would mean an extra `stat` call for every song) and
+    # read it in whole
+    input_path = join(song_text_dir_full_path, f"{file_id}.txt")
+    try:
+        raw_song_lyrics_file = open(input_path, encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("Song file does not exist yet: {}".format(input_path))
+        raise
+    with raw_song_lyrics_file:
+        return standardize_quotes(raw_song_lyrics_file.read()).strip()
+
+
+def htmlify_song(song: Song, albums: List[Album],
+                 song_text: Optional[str] = None) -> None:
     """
     Read in a raw text file containing lyrics and output an HTML file
     (unless the song is an instrumental and contains no lyrics).
@@ -689,6 +699,9 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
     :type song: Song
     :param albums: list of all Album objects
     :type albums: List[Album]
+    :param song_text: song text, if it has already been read in (see
+                      `read_song_text`)
+    :type song_text: Optional[str]
 
     :returns: None
     :rtype: None
@@ -698,65 +711,44 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
 
     file_id = song.file_id
     name = song.name
-    print("HTMLifying {}...".format(name), file=sys.stderr)
-
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(2))
-
-    # Create a body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 2))
-
-    # Make a tag for the name of the song
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h_tag = Tag(name="h1")
-    h_tag.string = name
-    columns_div.append(h_tag)
-    row_div.append(columns_div)
-    container_div.append(row_div)
+    logger.debug("HTMLifying {}...".format(name))
 
     # Process lines from raw lyrics file into different paragraph
     # elements
-    input_path = join(root_dir_path, text_dir_path, "{0}.txt".format(file_id))
-    if not exists(input_path):
-        print("Song file does not exist yet: {}".format(input_path),
-              file=sys.stderr)
-        raise FileNotFoundError
-    with open(input_path) as raw_song_lyrics_file:
-        song_lines = \
-            standardize_quotes(raw_song_lyrics_file.read()).strip().splitlines()
+    if song_text is None:
+        song_text = read_song_text(file_id)
+    song_lines = song_text.splitlines()
     paragraphs = []
     current_paragraph = []
     footnotes = []
     footnote_indices = []
-    for line_ind, line in enumerate(song_lines):
+    for line in song_lines:
         line = line.strip()
         if line:
 
             # If the line begins with an element that both starts with
             # and ends with two asterisks in a row, that means that it
-            # is a footnote line
-            split_line = line.split(" ", 1)
-            if split_line[0].startswith("**") and split_line[0].endswith("**"):
-                try:
-                    footnote_indices.append(int(split_line[0].replace("*", "")))
-                except ValueError:
-                    raise ValueError("{} contains what appears to be a "
-                                     "footnote line but it seems to not be "
-                                     "formatted correctly: {}".format(name, line))
-                footnotes.append(split_line[1])
-                continue
+            # is a footnote line (only lines starting with two
+            # asterisks need to be split up to find out)
+            if line.startswith("**"):
+                split_line = line.split(" ", 1)
+                if split_line[0].endswith("**"):
+                    try:
+                        footnote_indices.append(
+                            int(split_line[0].replace("*", "")))
+                    except ValueError:
+                        raise ValueError("{} contains what appears to be a "
+                                         "footnote line but it seems to not "
+                                         "be formatted correctly: {}"
+                                         .format(name, line))
+                    footnotes.append(split_line[1])
+                    continue
             current_paragraph.append(line)
-            if len(song_lines) == line_ind + 1:
-                paragraphs.append(current_paragraph)
-                current_paragraph = []
         else:
             paragraphs.append(current_paragraph)
             current_paragraph = []
+    if current_paragraph:
+        paragraphs.append(current_paragraph)
 
     # Make sure that the footnotes line up correctly in terms of
     # numbering
@@ -764,18 +756,17 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
         raise ValueError("The footnote indices for {} do not seem to be "
                          "numbered correctly.".format(name))
 
-    # Add paragraph elements with sub-elements of type `div` to the
-    # `body` element
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
+    # Start off the page content with a heading for the name of the
+    # song
+    song_html = [song_heading_template.format(name=escape_ampersands(name))]
+
+    # Add paragraph elements with sub-elements of type `div` (one per
+    # line)
     annotation_nums = []
     for paragraph in paragraphs:
-        paragraph_elem = Tag(name="p")
+        song_html.append("<p>")
         for line_elem in paragraph:
 
-            # Create new `div` element to store the line
-            div = Tag(name="div")
-
             # Check if line has annotations
             annotations = ANNOTATION_MARK_RE.findall(line_elem)
             if annotations:
@@ -787,23 +778,13 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
                                      " in {}.".format(name))
 
                 # Add the annotation number to the list of annotation
-                # numbers for the entire song
-                annotation_nums.extend([int(annotation.replace("*", ""))
-                                        for annotation in annotations])
-
-                # Get indices for the annotations in the given line
-                annotation_inds = find_annotation_indices(line_elem, annotations)
+                # numbers for the entire song (the matches are just the
+                # captured digits)
+                annotation_nums.extend(map(int, annotations))
 
-                # Remove annotation marks from the line
-                line_elem = remove_inline_annotation_marks(line_elem)
-
-                # Copy the contents of the line (after removing the
-                # annotations) into the `div` element
-                div.string = line_elem
-
-                # Iterate over the annotations, generating anchor
-                # elements that link the annotation to the note at the
-                # bottom of the page
+                # Replace the annotation marks with anchor elements that
+                # link the annotations to the notes at the bottom of the
+                # page (in a single substitution pass over the line)
                 # NOTE: Despite the fact that the code below is set up
                 # to deal with multiple annotations on a single line,
                 # the situation where there are multiple annotations on
@@ -812,41 +793,15 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
                 # multiple annotations on a single line will trigger an
                 # error before this point, which means that the list of
                 # annotations will always consist of only one
-                # annotation. 
-                for i, annotation_num in enumerate(annotations):
-                    href = "#{0}".format(annotation_num)
-                    a = Tag(name="a", attrs={"href": href})
-                    a.string = annotation_num
-                    a.string.wrap(Tag(name="sup"))
-
-                    # Insert the anchor element into the `div` element
-                    # at the appropriate location
-                    ind = annotation_inds[i]
-                    if ind == len(div.string):
-                        div.string.replace_with("{0}{1}"
-                                                .format(div.string, str(a)))
-                    else:
-                        div.string.replace_with("{0}{1}{2}"
-                                                .format(div.string[:ind], str(a),
-                                                        div.string[ind:]))
-
-                        # After putting annotations back into the
-                        # contents of the `div`, the indices of the
-                        # annotations afterwards will necessarily
-                        # change as they will be pushed back by the
-                        # length of the string that is being added
-                        for j in range(len(annotation_inds)):
-                            if j > i:
-                                annotation_inds[j] += len(a.string)
+                # annotation.
+                song_html.append("<div>{0}</div>".format(
+                    replace_annotation_marks_with_links(
+                        escape_ampersands(line_elem))))
             else:
+                song_html.append("<div>{0}</div>"
+                                 .format(escape_ampersands(line_elem)))
 
-                # Copy the contents of the line into the `div` element
-                div.string = line_elem
-
-            # Insert the `div` element into the paragraph element
-            paragraph_elem.append(div)
-
-        columns_div.append(paragraph_elem)
+        song_html.append("</p>")
 
     # Make sure that the footnotes and annotations line up correctly
     if footnote_indices or annotation_nums:
@@ -854,38 +809,27 @@ def htmlify_song(song: Song, albums: List[Album]) -> None:
             raise ValueError("The footnotes and annotations in {} do not match"
                              " up correctly.".format(name))
 
-
-    # Add in the footnotes section (if there are any)
+    # Add in the footnotes section (if there are any), assuming the the
+    # index of the list matches the natural ordering of the footnotes
     if footnotes:
-        footnotes_section = Tag(name="p")
-
-        # Iterate over the footnotes, assuming the the index of the
-        # list matches the natural ordering of the footnotes
-        for footnote_index, footnote in enumerate(footnotes):
-            div = Tag(name="div")
-            div.string = "\t{}".format(footnote)
-            div.string.wrap(Tag(name="small"))
-
-            # Generate a named anchor element for the footnote
-            a = Tag(name="a", attrs={"name": str(footnote_index + 1)})
-            a.string = str(footnote_index + 1)
-            a.string.wrap(Tag(name="sup"))
-            div.small.insert_before(a)
-            footnotes_section.append(div)
-
-        # Insert footnotes section at the next index
-        columns_div.append(footnotes_section)
-
-    # Add content to body and put body in HTML element
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    body.append(container_div)
-    html.append(body)
-
-    # Write out "prettified" HTML to the output file
-    html_output_path = join(songs_dir, "html", "{0}.html".format(file_id))
-    with open(join(root_dir_path, html_output_path), "w") as song_file:
-        print(prepare_html(html), file=song_file, end="")
+        song_html.append("<p>")
+        song_html.extend([footnote_template
+                          .format(num=footnote_index + 1,
+                                  footnote=escape_ampersands(footnote))
+                          for footnote_index, footnote
+                          in enumerate(footnotes)])
+        song_html.append("</p>")
+
+    song_html.append("</div></div></div>")
+
+    # Write out the HTML to the output file, putting the content
+    # together with the pre-rendered head element (containing
+    # stylesheets, Javascript, etc.) and a navigation bar
+    html_output_path = join(song_html_dir_full_path, f"{file_id}.html")
+    with open(html_output_path, "w", encoding="utf-8",
+              buffering=page_buffer_size) as song_file:
+        write_html_page(song_file, head_html_by_level[2],
+                        render_navbar(albums, 2), song_html)
 
 
 def htmlify_main_song_index_page(song_files_dict: SongsRelatedAlbumsDictType,
@@ -903,27 +847,11 @@ def htmlify_main_song_index_page(song_files_dict: SongsRelatedAlbumsDictType,
     :rtype: None
     """
 
-    print("HTMLifying the main songs index page...", file=sys.stderr)
+    logger.info("HTMLifying the main songs index page...")
 
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(2))
-
-    # Create a body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 2))
-
-    # Make a container div for the index
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h = Tag(name="h1")
-    h.string = "Songs Index"
-    columns_div.append(h)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    container_div.append(Tag(name="p"))
+    # Start off the index with a heading (the links to the index
+    # pages for each letter get added below)
+    index_html = [index_heading_template.format(title="Songs Index")]
 
     for letter in ascii_uppercase:
 
@@ -932,30 +860,16 @@ def htmlify_main_song_index_page(song_files_dict: SongsRelatedAlbumsDictType,
         # generated (no songs to index for the given letter) and,
         # therefore, that this letter should be skipped.
         if not htmlify_song_index_page(letter, song_files_dict, albums):
-            print("Skipping generating an index page for {0} since no songs "
-                  "could be found...".format(letter))
+            logger.info("Skipping generating an index page for {0} since no "
+                        "songs could be found...".format(letter))
             continue
 
-        row_div = Tag(name="div", attrs={"class": "row"})
-        columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-        div = Tag(name="div")
-        letter_tag = Tag(name="letter")
-        a = Tag(name="a",
-                attrs={"href": join("{0}.html".format(letter.lower()))})
-        a.string = letter
-        bold = Tag(name="strong", attrs={"style": "font-size: 125%;"})
-        a.string.wrap(bold)
-        letter_tag.append(a)
-        div.append(letter_tag)
-        columns_div.append(div)
-        row_div.append(columns_div)
-        container_div.append(row_div)
-
-    body.append(container_div)
-    html.append(body)
+        index_html.append(index_letter_links[letter])
+    index_html.append("</div>")
 
     with open(songs_index_html_file_path, "w") as songs_index_file:
-        print(prepare_html(html), file=songs_index_file, end="")
+        write_html_page(songs_index_file, head_html_by_level[2],
+                        render_navbar(albums, 2), index_html)
 
 
 def htmlify_song_index_page(letter: str,
@@ -978,44 +892,19 @@ def htmlify_song_index_page(letter: str,
     :rtype: bool
     """
 
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(2))
-
-    # Create body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 2))
-
-    # Make a container div tag to store the content
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h = Tag(name="h1")
-    h.string = letter
-    columns_div.append(h)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    container_div.append(Tag(name="p"))
-
     # Iterate over all songs (not versions of songs, but a more
-    # abstract sense of "songs")
+    # abstract sense of "songs"), building up the content of the page
+    # as a list of HTML strings rather than as a tree of `Tag` objects
     not_dylan = "not written by or not performed by Bob Dylan"
-    no_songs = True
+    song_divs = []
     for song in sort_titles(list(song_files_dict), letter):
 
-        # If the program gets here, there are songs; if not, the value
-        # will not change, i.e., it will be True
-        no_songs = False
-
         # Get information about the song, such as the different
         # versions of the song, their file IDs, which albums they
         # occurred on, whether they were instrumentals, etc.
         song_info = song_files_dict[song]
+        song_name = escape_ampersands(song)
 
-        row_div = Tag(name="div", attrs={"class": "row"})
-        columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-        div = Tag(name="div")
         if len(song_info) == 1:
             song_info = cytoolz.first(song_info)
             album_links = and_join_album_links(sorted(song_info["album(s)"],
@@ -1026,74 +915,59 @@ def htmlify_song_index_page(letter: str,
                 instrumental_or_not_dylan = song_info["file_id"]
                 if instrumental_or_not_dylan != "instrumental":
                     instrumental_or_not_dylan = not_dylan
-                div.append(song)
-                comment = Tag(name="comment")
-                comment.string = (" ({0}, appeared on {1})"
-                                  .format(instrumental_or_not_dylan,
-                                          album_links))
-                div.append(comment)
-                row_div.append(div)
-                columns_div.append(row_div)
+                song_html = ("{0}<comment> ({1}, appeared on {2})</comment>"
+                             .format(song_name, instrumental_or_not_dylan,
+                                     album_links))
             else:
-                song_html_file_path = \
-                    "../html/{0}.html".format(song_info["file_id"])
-                a_song = Tag(name="a", attrs={"href": song_html_file_path})
-                a_song.string = song
-                div.append(a_song)
-                comment = Tag(name="comment")
-                comment.string = " (appeared on {0})".format(album_links)
-                div.append(comment)
+                song_html = ('<a href="../html/{0}.html">{1}</a>'
+                             "<comment> (appeared on {2})</comment>"
+                             .format(song_info["file_id"], song_name,
+                                     album_links))
         else:
-            div.string = song
-            columns_div.append(div)
 
             # Make an unordered list for the different versions of the
             # song
-            ul = Tag(name="ul")
+            version_lis = []
             for i, version_info in enumerate(song_info):
-                li = Tag(name="li")
 
                 # Add in instrumental entries (but with no link to the
                 # song pages since they don't exist), but don't even
                 # add in entries for the songs that have been deemed as
                 # non-Dylan songs
-                if version_info["file_id"] == "instrumental":
-                    album_links = and_join_album_links(
-                                      sorted(version_info["album(s)"],
-                                             key=lambda x: x["release_date"]))
-                    comment = Tag(name="comment")
-                    comment.string = ("Instrumental version (appeared on {0})"
-                                      .format(album_links))
-                    li.append(comment)
-                elif version_info["file_id"] == "not_written_or_peformed_by_dylan":
+                if (version_info["file_id"] ==
+                    "not_written_or_peformed_by_dylan"):
                     continue
+                album_links = and_join_album_links(
+                                  sorted(version_info["album(s)"],
+                                         key=lambda x: x["release_date"]))
+                if version_info["file_id"] == "instrumental":
+                    version_lis.append("<li><comment>Instrumental version "
+                                       "(appeared on {0})</comment></li>"
+                                       .format(album_links))
                 else:
-                    album_links = and_join_album_links(
-                                      sorted(version_info["album(s)"],
-                                             key=lambda x: x["release_date"]))
-                    href = "../html/{0}.html".format(version_info["file_id"])
-                    a = Tag(name="a", attrs={"href": href})
-                    a.string = "Version #{0}".format(i + 1)
-                    li.append(a)
-                    comment = Tag(name="comment")
-                    comment.string = " (appeared on {0})".format(album_links)
-                    li.append(comment)
-                ul.append(li)
-            div.append(ul)
-        row_div.append(div)
-        columns_div.append(row_div)
-        container_div.append(columns_div)
-
-    if no_songs:
+                    version_lis.append('<li><a href="../html/{0}.html">'
+                                       "Version #{1}</a><comment> (appeared "
+                                       "on {2})</comment></li>"
+                                       .format(version_info["file_id"], i + 1,
+                                               album_links))
+            song_html = "{0}<ul>{1}</ul>".format(song_name,
+                                                 "".join(version_lis))
+
+        song_divs.append('<div class="col-md-12"><div class="row"><div>{0}'
+                         "</div></div></div>".format(song_html))
+
+    if not song_divs:
         return False
 
-    body.append(container_div)
-    html.append(body)
-
+    # Write out the song entries one by one in a container div tag
+    # under a heading for the letter
+    heading = index_heading_template.format(title=letter)
     song_letter_index_file_path = join(root_dir_path, song_index_dir_path,
-                                       "{0}.html".format(letter.lower()))
+                                       f"{letter.lower()}.html")
     with open(song_letter_index_file_path, "w") as letter_index_file:
-        print(prepare_html(html), file=letter_index_file, end="")
+        write_html_page(letter_index_file, head_html_by_level[2],
+                        render_navbar(albums, 2),
+                        chain([heading], song_divs, ["</div>"]))
 
     return True
 
@@ -1109,27 +983,20 @@ def htmlify_main_album_index_page(albums: List[Album]):
     :rtype: None
     """
 
-    print("HTMLifying the main albums index page...", file=sys.stderr)
-
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(2))
+    logger.info("HTMLifying the main albums index page...")
 
-    # Create a body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 2))
+    # Start off the index with a heading (the links to the index
+    # pages for each letter get added below)
+    index_html = [index_heading_template.format(title="Albums Index")]
 
-    # Make a container div for the index
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h = Tag(name="h1")
-    h.string = "Albums Index"
-    columns_div.append(h)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    container_div.append(Tag(name="p"))
+    # Clean up and sort the album names once and then group the albums
+    # by the first letter of their cleaned-up names (keeping the first
+    # album with a given name, if there are duplicates)
+    albums_by_name = {album.name: album for album in reversed(albums)}
+    albums_by_letter = cytoolz.groupby(
+        lambda album: clean_title(album.name)[:1],
+        [albums_by_name[album.name] for album
+         in sorted(albums, key=lambda album: clean_title(album.name))])
 
     for letter in ascii_uppercase:
 
@@ -1137,39 +1004,30 @@ def htmlify_main_album_index_page(albums: List[Album]):
         # of False is returned, it means that no index page could be
         # generated (no albums to index for the given letter) and,
         # therefore, that this letter should be skipped.
-        if not htmlify_album_index_page(letter, albums):
-            print("Skipping generating an index page for {0} since no albums "
-                  "could be found...".format(letter))
+        if not htmlify_album_index_page(
+                letter, albums_by_letter.get(letter.lower(), []), albums):
+            logger.info("Skipping generating an index page for {0} since no "
+                        "albums could be found...".format(letter))
             continue
 
-        row_div = Tag(name="div", attrs={"class": "row"})
-        columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-        div = Tag(name="div")
-        letter_tag = Tag(name="letter")
-        a = Tag(name="a",
-                attrs={"href": join("{0}.html".format(letter.lower()))})
-        a.string = letter
-        bold = Tag(name="strong", attrs={"style": "font-size: 125%;"})
-        a.string.wrap(bold)
-        letter_tag.append(a)
-        div.append(letter_tag)
-        columns_div.append(div)
-        row_div.append(columns_div)
-        container_div.append(row_div)
-
-    body.append(container_div)
-    html.append(body)
+        index_html.append(index_letter_links[letter])
+    index_html.append("</div>")
 
     with open(albums_index_html_file_path, "w") as albums_index_file:
-        print(prepare_html(html), file=albums_index_file, end="")
+        write_html_page(albums_index_file, head_html_by_level[2],
+                        render_navbar(albums, 2), index_html)
 
 
-def htmlify_album_index_page(letter: str, albums: List[Album]) -> bool:
+def htmlify_album_index_page(letter: str, letter_albums: List[Album],
+                             albums: List[Album]) -> bool:
     """
     Generate a specific albums index page.
 
     :param letter: index letter
     :type letter: str
+    :param letter_albums: list of Album objects to index under the
+                          letter, already sorted by title
+    :type letter_albums: List[Album]
     :param albums: list of Album objects
     :type albums: List[Album]
 
@@ -1179,61 +1037,25 @@ def htmlify_album_index_page(letter: str, albums: List[Album]) -> bool:
     :rtype: bool
     """
 
-    # Make BeautifulSoup object and append head element containing
-    # stylesheets, Javascript, etc.
-    html = Tag(name="html")
-    html.append(make_head_element(2))
-
-    # Create body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 2))
-
-    # Make a container div tag to store the content
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h = Tag(name="h1")
-    h.string = letter
-    columns_div.append(h)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    container_div.append(Tag(name="p"))
-
-    no_albums = True
-    for album_name in sort_titles([album.name for album in albums], letter):
-
-        # If the program gets here, there are albums; if not, the value
-        # will not change, i.e., it will be True
-        no_albums = False
-
-        # Get album metadata
-        album = [album for album in albums if album.name == album_name][0]
-
-        row_div = Tag(name="div", attrs={"class": "row"})
-        columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-        div = Tag(name="div")
-        a_album = Tag(name="a",
-                      attrs={"href": join("..",
-                                          "{0}.html".format(album.file_id))})
-        a_album.string = "{0} ".format(album_name)
-        div.append(a_album)
-        comment = Tag(name="comment")
-        comment.string = "({0})".format(album.release_date.split()[-1])
-        div.append(comment)
-        row_div.append(div)
-        columns_div.append(row_div)
-        container_div.append(columns_div)
-
-    if no_albums:
+    # If there are no albums to index for the letter, no page gets
+    # generated
+    if not letter_albums:
         return False
 
-    body.append(container_div)
-    html.append(body)
+    # Start off the page content with a heading for the letter
+    index_html = [index_heading_template.format(title=letter)]
+    for album in letter_albums:
+        index_html.append(album_index_entry_template
+                          .format(file_id=album.file_id,
+                                  name=escape_ampersands(album.name),
+                                  year=album.year))
+    index_html.append("</div>")
 
     album_letter_index_file_path = join(root_dir_path, album_index_dir_path,
-                                        "{0}.html".format(letter.lower()))
+                                        f"{letter.lower()}.html")
     with open(album_letter_index_file_path, "w") as letter_index_file:
-        print(prepare_html(html), file=letter_index_file, end="")
+        write_html_page(letter_index_file, head_html_by_level[2],
+                        render_navbar(albums, 2), index_html)
 
     return True
 
@@ -1249,9 +1071,13 @@ def htmlify_downloads_page(albums: List[Album]) -> None:
     :rtype: None
     """
 
-    # Get the size of the files in KiB
-    file_sizes_dict = {file_path: ceil(getsize(file_path)/1024) for file_path
-                       in glob(join(file_dumps_dir_path, "*.txt"))}
+    # Get the size of the files in KiB (the directory entries returned
+    # by `scandir` already hold the full paths and cache their `stat`
+    # results)
+    with scandir(file_dumps_dir_path) as entries:
+        file_sizes_dict = {entry.path: ceil(entry.stat().st_size/1024)
+                           for entry in entries
+                           if entry.name.endswith(".txt")}
     metadata_csv_file_path = join(file_dumps_dir_path,
                                   all_songs_with_metadata_csv_file_name)
     metadata_jsonlines_file_path = \
@@ -1261,28 +1087,13 @@ def htmlify_downloads_page(albums: List[Album]) -> None:
     file_sizes_dict[metadata_jsonlines_file_path] = \
         ceil(getsize(metadata_jsonlines_file_path)/1024)
 
-    html = Tag(name="html")
-    html.append(make_head_element(1))
-
-    # Create body element and add in a navigation bar
-    body = Tag(name="body")
-    body.append(make_navbar_element(albums, 1))
-
-    # Make a tag for download links
-    container_div = Tag(name="div", attrs={"class": "container"})
-    row_div = Tag(name="div", attrs={"class": "row"})
-    columns_div = Tag(name="div", attrs={"class": "col-md-12"})
-    h3 = Tag(name="h3")
-    h3.string = "Lyrics File Downloads"
-    columns_div.append(h3)
+    # Make a list of download links (each noting the last album that
+    # the lyrics go up to)
     last_album = albums[-1]
-    last_album_a = Tag(name="a",
-                       attrs={"href": join("..", albums_dir,
-                                           "{0}.html".format(last_album.file_id))})
-    last_album_a.string = last_album.name
-    i = Tag(name="i")
-    i.append(last_album_a)
-    ul = Tag(name="ul")
+    last_album_href = escape_ampersands(f"{album_href_prefix}"
+                                        f"{last_album.file_id}.html")
+    last_album_name = escape_ampersands(last_album.name)
+    download_lis = []
     for file_path in file_sizes_dict:
         file_name = basename(file_path)
         if file_name == all_songs_with_metadata_file_name:
@@ -1304,22 +1115,18 @@ def htmlify_downloads_page(albums: List[Album]) -> None:
         else:
             raise RuntimeError("`text` seems to be unset in "
                                "`htmlify_downloads_page`?")
-        download_a = ("<a href={0} download>{0}</a>: {1} (up to and including "
-                      "{2}) ({3} KiB)"
-                      .format(file_name, text, clean_up_html(str(i)),
-                              file_sizes_dict[file_path]))
-        li = Tag(name="li")
-        li.string = download_a
-        ul.append(li)
-    columns_div.append(ul)
-    row_div.append(columns_div)
-    container_div.append(row_div)
-    body.append(container_div)
-    html.append(body)
+        download_lis.append(download_li_template
+                            .format(file_name=file_name, description=text,
+                                    last_album_href=last_album_href,
+                                    last_album_name=last_album_name,
+                                    size=file_sizes_dict[file_path]))
 
     with open(join(file_dumps_dir_path,
                    downloads_file_name), "w") as downloads_file:
-        print(prepare_html(html), file=downloads_file, end="")
+        write_html_page(downloads_file, head_html_by_level[1],
+                        render_navbar(albums, 1),
+                        [downloads_template
+                         .format(download_lis="".join(download_lis))])
 
 
 def main():
@@ -1345,36 +1152,62 @@ def main():
                              "available).",
                         action="store_true",
                         default=False)
+    parser.add_argument("--n_jobs",
+                        help="Number of worker processes to use when "
+                             "generating the album/song pages (defaults to "
+                             "the number of CPUs; use 1 to generate them all "
+                             "in the main process, e.g., for debugging).",
+                        type=int,
+                        default=None)
+    parser.add_argument("--only_changed_songs",
+                        help="Only regenerate the song pages for songs whose "
+                             "lyrics text files (or the index file or the "
+                             "code) have changed since their pages were last "
+                             "generated.",
+                        action="store_true",
+                        default=False)
+    parser.add_argument("--verbose",
+                        help="Report progress for each individual album/song "
+                             "page as well.",
+                        action="store_true",
+                        default=False)
     args = parser.parse_args()
 
+    # Report progress on stderr (only reporting on individual albums and
+    # songs in verbose mode)
+    logging.basicConfig(format="%(message)s",
+                        level=logging.DEBUG if args.verbose else logging.INFO)
+
     # Read in contents of the albums_and_songs_index.jsonlines file,
     # constructing a dictionary of albums and the associated songs,
     # etc.
-    print("Reading the albums_and_songs_index.jsonlines file and building up "
-          "index of albums and songs...",
-          file=sys.stderr)
+    logger.info("Reading the albums_and_songs_index.jsonlines file and "
+                "building up index of albums and songs...")
     (albums,
      song_files_dict) = read_songs_index(songs_and_albums_index_json_file_path)
 
     # Generate HTML files for the main index page, albums, songs, etc.
     # and write raw lyrics files (for downloading), if requested
-    print("Generating HTML files for the main page, albums, songs, etc....",
-          file=sys.stderr)
+    logger.info("Generating HTML files for the main page, albums, songs, "
+                "etc....")
     generate_index_page(albums)
     allow_file_not_found_error = args.allow_file_not_found_error
     if args.make_downloads:
-        print("Generating the lyrics download files...", file=sys.stderr)
+        logger.info("Generating the lyrics download files...")
         generate_lyrics_download_files(
-            htmlify_everything(albums,
-                               song_files_dict,
-                               make_downloads=True,
-                               allow_file_not_found_error=allow_file_not_found_error))
+            htmlify_everything(
+                albums, song_files_dict, make_downloads=True,
+                allow_file_not_found_error=allow_file_not_found_error,
+                n_jobs=args.n_jobs,
+                only_changed_songs=args.only_changed_songs))
         htmlify_downloads_page(albums)
     else:
-        htmlify_everything(albums, song_files_dict,
-                           allow_file_not_found_error=allow_file_not_found_error)
+        htmlify_everything(
+            albums, song_files_dict,
+            allow_file_not_found_error=allow_file_not_found_error,
+            n_jobs=args.n_jobs, only_changed_songs=args.only_changed_songs)
 
-    print("Program complete.", file=sys.stderr)
+    logger.info("Program complete.")
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ setup(name='bob_dylan_lyrics',
       author_email='mulhodm@gmail.com',
       include_package_data=True,
       install_requires=reqs(),
+      python_requires='>=3.6',
       packages=find_packages(),
       entry_points={'console_scripts':
                         ['htmlify = bob_dylan_lyrics.htmlify:main']},
@@ -27,14 +28,8 @@ setup(name='bob_dylan_lyrics',
       classifiers=['Intended Audience :: Science/Research',
                    'Intended Audience :: Developers',
                    'License :: ',
-                   'Programming Language :: Python :: 3.5',
-                   'Programming Language :: Python :: 3.4',
-                   'Programming Language :: Python :: 3.3',
-                   'Programming Language :: Python :: 3.2',
-                   'Programming Language :: Python :: 3.1',
+                   'Programming Language :: Python :: 3.6',
                    'Programming Language :: Python :: 3',
-                   'Programming Language :: Python :: 2.7',
-                   'Programming Language :: Python :: 2.6',
                    'Topic :: Scientific/Engineering',
                    'Operating System :: POSIX',
                    'Operating System :: Unix',